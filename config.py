@@ -0,0 +1,41 @@
+# config.py
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Process-wide runtime settings parsed from the environment once."""
+    host: str
+    port: int
+    reload: bool
+    workers: int
+    thread_pool_size: int
+    validation_concurrency: int
+    domain_set_refresh_seconds: int
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the cached settings singleton.
+
+    The first call reads `.env` from disk and parses every environment
+    variable; subsequent calls (from any module) return the same object,
+    so importing modules no longer each trigger their own `load_dotenv()`
+    disk read and `os.getenv` parsing.
+    """
+    load_dotenv()
+    return Settings(
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", "8000")),
+        reload=os.getenv("RELOAD", "false").lower() == "true",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        thread_pool_size=int(os.getenv("THREAD_POOL_SIZE", "32")),
+        validation_concurrency=int(os.getenv("VALIDATION_CONCURRENCY", "4")),
+        domain_set_refresh_seconds=int(os.getenv("DOMAIN_SET_REFRESH_SECONDS", "3600")),
+    )
@@ -1,13 +1,15 @@
 # db/connector.py
 
 import pyodbc
+import aioodbc
 import os
-from dotenv import load_dotenv
+import queue
 from contextlib import contextmanager
+from config import get_settings
 from utils.logger import get_logger
 
 logger = get_logger("db_connector")
-load_dotenv()
+get_settings()  # ensures .env is loaded (once, process-wide)
 
 # Load database connection details from environment variables
 # Use 'localhost' or 'localhost\INSTANCE_NAME' as appropriate
@@ -40,25 +42,122 @@ connection_string = (
 logger.info(f"Using DB Connection String (Trusted): DRIVER={DB_DRIVER};SERVER={DB_SERVER};DATABASE={DB_DATABASE};Trusted_Connection=yes;")
 
 
+# Enable pyodbc's driver-level connection pooling so even connections we do
+# open/close are recycled by the driver manager instead of paying the full
+# TCP + auth handshake each time.
+pyodbc.pooling = True
+
+# Small application-level pool on top: short DAO transactions are dominated by
+# connect latency, so reusing live connections amortizes that cost.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+_pool: "queue.Queue[pyodbc.Connection]" = queue.Queue(maxsize=POOL_SIZE)
+
+
+def _create_connection() -> pyodbc.Connection:
+    """Opens a new database connection (Windows Auth, autocommit off)."""
+    logger.debug("Attempting to connect to the database using Windows Authentication...")
+    # Set autocommit=False for better transaction control within DAO functions
+    conn = pyodbc.connect(connection_string, autocommit=False)
+    logger.debug("Database connection successful.")
+    return conn
+
+
 @contextmanager
-def get_db_connection():
-    """Provides a database connection using a context manager (Windows Auth)."""
+def get_db_connection(autocommit: bool = False):
+    """
+    Provides a pooled database connection using a context manager (Windows Auth).
+
+    Pass autocommit=True for single-statement writes: the driver commits
+    inline with the statement, saving the separate commit round-trip.
+    """
     conn = None
     try:
-        logger.debug("Attempting to connect to the database using Windows Authentication...")
-        # Set autocommit=False for better transaction control within DAO functions
-        conn = pyodbc.connect(connection_string, autocommit=False)
-        logger.debug("Database connection successful.")
+        try:
+            conn = _pool.get_nowait()
+            logger.debug("Reusing pooled database connection.")
+            # Health-ping: a pooled connection may have been dropped by the
+            # server while idle; reconnect instead of handing out a dead one
+            try:
+                conn.execute("SELECT 1").fetchone()
+            except pyodbc.Error:
+                logger.warning("Pooled connection failed health check; reconnecting.")
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                conn = _create_connection()
+        except queue.Empty:
+            conn = _create_connection()
+        if conn.autocommit != autocommit:
+            conn.autocommit = autocommit
         yield conn
     except pyodbc.Error as ex:
         sqlstate = ex.args[0]
-        logger.error(f"Database connection error (SQLSTATE: {sqlstate}): {ex}")
+        logger.error("Database connection error (SQLSTATE: %s): %s", sqlstate, ex)
+        # A connection that errored may be in a bad state; drop it rather than pool it
+        if conn:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            conn = None
         # Re-raise as a standard ConnectionError for consistent handling
         raise ConnectionError(f"Failed to connect to database: {ex}") from ex
     except Exception as e:
-        logger.error(f"An unexpected error occurred during database connection: {e}")
+        logger.error("An unexpected error occurred during database connection: %s", e)
         raise ConnectionError(f"Unexpected error connecting to database: {e}") from e
     finally:
         if conn:
-            logger.debug("Closing database connection.")
+            try:
+                # Reset to transactional mode and clear any uncommitted state
+                # before the next checkout
+                conn.autocommit = False
+                conn.rollback()
+                _pool.put_nowait(conn)
+                logger.debug("Returned database connection to pool.")
+            except queue.Full:
+                logger.debug("Pool full; closing database connection.")
+                conn.close()
+            except Exception:
+                logger.debug("Connection unusable; closing instead of pooling.")
+                conn.close()
+
+
+# Async pool for read paths: aioodbc runs pyodbc on its own executor with a
+# real connection pool, so async DAO calls don't occupy the default threadpool.
+_async_pool = None
+
+
+async def get_async_pool() -> aioodbc.Pool:
+    """Returns the shared aioodbc connection pool, creating it on first use."""
+    global _async_pool
+    if _async_pool is None:
+        logger.info("Creating aioodbc connection pool (minsize=2, maxsize=20)...")
+        _async_pool = await aioodbc.create_pool(dsn=connection_string, minsize=2, maxsize=20)
+    return _async_pool
+
+
+async def close_async_pool():
+    """Closes the shared aioodbc pool (call on application shutdown)."""
+    global _async_pool
+    if _async_pool is not None:
+        _async_pool.close()
+        await _async_pool.wait_closed()
+        _async_pool = None
+        logger.info("Closed aioodbc connection pool.")
+
+
+def close_pool():
+    """Closes all pooled connections (call on application shutdown)."""
+    closed = 0
+    while True:
+        try:
+            conn = _pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
             conn.close()
+            closed += 1
+        except Exception as e:
+            logger.warning("Error closing pooled connection: %s", e)
+    logger.info("Closed %d pooled database connections.", closed)
@@ -1,150 +1,260 @@
 # db/email_dao.py
 
-from db.connector import get_db_connection # Correctly import from the connector
+import os
+import logging
+import concurrent.futures
+from db.connector import get_db_connection, get_async_pool # Correctly import from the connector
 from utils.logger import get_logger
-from typing import List, Tuple, Dict, Any # Added type hints
+from typing import AsyncIterator, List, Tuple, Dict, Any # Added type hints
 
 logger = get_logger("email_dao")
 
+# Dedicated executor for blocking DAO calls made from async code, sized to the
+# connection pool so DB work doesn't contend with everything else offloaded to
+# asyncio's shared default threadpool.
+DB_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("DB_POOL_SIZE", "5")),
+    thread_name_prefix="db"
+)
+
+# Module-level SQL constants so pyodbc can reuse the prepared statement handle
+# across calls instead of re-preparing the text every time.
+#
+# Single-row upsert: UPDATE-then-INSERT under UPDLOCK/HOLDLOCK avoids the plan
+# overhead and concurrency quirks of a one-row MERGE on SQL Server. MERGE is
+# kept only for the bulk staging path.
+CONTACT_UPSERT_SQL = """
+    UPDATE contacts WITH (UPDLOCK, HOLDLOCK)
+    SET firstname = ?, lastname = ?, email = ?
+    WHERE contact_id = ?;
+    IF @@ROWCOUNT = 0
+        INSERT INTO contacts (contact_id, firstname, lastname, email)
+        VALUES (?, ?, ?, ?);
+"""
+
+# Staging-table bulk upsert: load all incoming rows into a session-local temp
+# table in one batched insert, then merge them into contacts with a single
+# statement so the server plans the join once instead of once per row.
+# The conditional DROP guards against a leftover #staging on a reused
+# (pooled or caller-supplied) connection — temp tables live for the session.
+STAGING_CREATE_SQL = """
+    IF OBJECT_ID('tempdb..#staging') IS NOT NULL DROP TABLE #staging;
+    CREATE TABLE #staging (
+        contact_id NVARCHAR(64) PRIMARY KEY,
+        firstname NVARCHAR(200),
+        lastname NVARCHAR(200),
+        email NVARCHAR(320)
+    )
+"""
+
+STAGING_INSERT_SQL = "INSERT INTO #staging (contact_id, firstname, lastname, email) VALUES (?, ?, ?, ?)"
+
+# Commit every N rows so a very large batch doesn't balloon the transaction
+# log or escalate locks for the whole run.
+UPSERT_BATCH_SIZE = int(os.getenv("DB_UPSERT_BATCH_SIZE", "5000"))
+
+STAGING_MERGE_SQL = """
+    MERGE contacts WITH (TABLOCK) AS target
+    USING #staging AS source
+    ON target.contact_id = source.contact_id
+    WHEN MATCHED THEN
+        UPDATE SET
+            firstname = source.firstname,
+            lastname = source.lastname,
+            email = source.email
+    WHEN NOT MATCHED THEN
+        INSERT (contact_id, firstname, lastname, email)
+        VALUES (source.contact_id, source.firstname, source.lastname, source.email);
+"""
+
 # --- Contact Functions ---
 
 def upsert_contact_db(contact_id_val: str, firstname: str, lastname: str, email: str): # Renamed arg for clarity
     """
-    Inserts or updates a single contact in the database using MERGE.
+    Inserts or updates a single contact in the database using an
+    UPDATE-then-INSERT upsert (see CONTACT_UPSERT_SQL).
     Uses 'contact_id' as the primary key column name.
     """
     if not contact_id_val or not email:
-        logger.warning(f"Skipping upsert for contact due to missing ID or Email: ID={contact_id_val}, Email={email}")
+        logger.warning("Skipping upsert for contact due to missing ID or Email: ID=%s, Email=%s", contact_id_val, email)
         return
 
-    logger.debug(f"Attempting to upsert contact {contact_id_val} ({email})")
-    # Updated SQL to use 'contact_id' as the column name
-    sql = """
-        MERGE INTO contacts AS target
-        USING (SELECT ? AS contact_id, ? AS firstname, ? AS lastname, ? AS email) AS source
-        ON target.contact_id = source.contact_id -- Join on 'contact_id'
-        WHEN MATCHED THEN
-            UPDATE SET
-                firstname = source.firstname,
-                lastname = source.lastname,
-                email = source.email
-        WHEN NOT MATCHED THEN
-            INSERT (contact_id, firstname, lastname, email) -- Insert into 'contact_id'
-            VALUES (source.contact_id, source.firstname, source.lastname, source.email);
-    """
-    # Params order matches the SELECT in USING clause
-    params = (contact_id_val, firstname, lastname, email)
+    logger.debug("Attempting to upsert contact %s (%s)", contact_id_val, email)
+    # UPDATE params first, then the INSERT params for the @@ROWCOUNT=0 branch
+    params = (firstname, lastname, email, contact_id_val,
+              contact_id_val, firstname, lastname, email)
 
     try:
+        # Transactional on purpose: CONTACT_UPSERT_SQL is a two-statement
+        # batch, and the UPDLOCK/HOLDLOCK range lock must survive from the
+        # UPDATE into the conditional INSERT. Under autocommit each statement
+        # commits (and releases locks) independently, reopening the
+        # concurrent-insert race the lock hints exist to prevent.
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(sql, params)
-            logger.debug(f"Executed MERGE for contact {contact_id_val}")
+            cursor.execute(CONTACT_UPSERT_SQL, params)
             conn.commit()
-            logger.info(f"✅ Successfully committed upsert for contact {contact_id_val}")
+            logger.info("Successfully committed upsert for contact %s", contact_id_val)
     except Exception as e:
-        logger.error(f"💥 Error upserting contact {contact_id_val}: {e}", exc_info=True)
+        logger.error("Error upserting contact %s: %s", contact_id_val, e, exc_info=True)
         raise
 
 # --- Contact Functions ---
 
-def insert_contacts(contacts: List[Dict[str, Any]]):
+async def aupsert_contact_db(contact_id_val: str, firstname: str, lastname: str, email: str):
+    """
+    Async variant of upsert_contact_db, using the shared aioodbc pool.
+
+    Awaiting this directly from async code skips the executor thread-hop and
+    reuses pooled connections instead of competing for DB_EXECUTOR slots.
+    """
+    if not contact_id_val or not email:
+        logger.warning("Skipping upsert for contact due to missing ID or Email: ID=%s, Email=%s", contact_id_val, email)
+        return
+
+    logger.debug("Attempting to upsert contact %s (%s) via async pool", contact_id_val, email)
+    params = (firstname, lastname, email, contact_id_val,
+              contact_id_val, firstname, lastname, email)
+
+    try:
+        pool = await get_async_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(CONTACT_UPSERT_SQL, params)
+            await conn.commit()
+        logger.info("Successfully committed upsert for contact %s", contact_id_val)
+    except Exception as e:
+        logger.error("Error upserting contact %s: %s", contact_id_val, e, exc_info=True)
+        raise
+
+
+def insert_contacts(contacts: List[Dict[str, Any]], conn=None):
     """
     Inserts or updates contacts in the database using MERGE.
     Uses 'contact_id' as the primary key column name.
+
+    Args:
+        contacts: HubSpot-shaped contact dicts ({'id', 'properties': {...}}).
+        conn: An open connection to reuse. Callers flushing several chunks
+              (e.g. sync_contacts.sync) pass one connection down so the whole
+              run pays a single checkout instead of one per chunk.
     """
     if not contacts:
         logger.info("No contacts provided to insert_contacts.")
         return
 
-    logger.info(f"Attempting to insert/update {len(contacts)} contacts.")
-    # Use a set to track processed IDs if needed, though MERGE handles duplicates
-    # processed_ids = set()
+    logger.info("Attempting to insert/update %d contacts.", len(contacts))
+
+    # Build the parameter rows up front, skipping contacts missing an ID or email.
+    rows = []
+    for contact in contacts:
+        contact_id_val = contact.get('id') # Still gets 'id' from HubSpot data
+        properties = contact.get('properties', {})
+        email = properties.get('email')
+        firstname = properties.get('firstname', '') # Default to empty string
+        lastname = properties.get('lastname', '')   # Default to empty string
+
+        if not contact_id_val or not email:
+            logger.warning("Skipping contact due to missing ID or Email in batch insert: ID=%s, Email=%s", contact_id_val, email)
+            continue # Skip this contact and move to the next
+
+        rows.append((contact_id_val, firstname, lastname, email))
+
+    if not rows:
+        logger.info("No valid contacts to insert after filtering.")
+        return
 
     # It's generally better to commit once after all operations succeed or fail together
     try: # Outer try for the whole batch
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-
-            for contact in contacts:
-                contact_id_val = contact.get('id') # Still gets 'id' from HubSpot data
-                properties = contact.get('properties', {})
-                email = properties.get('email')
-                firstname = properties.get('firstname', '') # Default to empty string
-                lastname = properties.get('lastname', '')   # Default to empty string
-
-                if not contact_id_val or not email:
-                    logger.warning(f"Skipping contact due to missing ID or Email in batch insert: ID={contact_id_val}, Email={email}")
-                    continue # Skip this contact and move to the next
-
-                # Inner try for each individual MERGE operation
-                try:
-                    # Updated SQL to use 'contact_id'
-                    cursor.execute("""
-                        MERGE INTO contacts AS target
-                        USING (SELECT ? AS contact_id, ? AS firstname, ? AS lastname, ? AS email) AS source
-                        ON target.contact_id = source.contact_id
-                        WHEN MATCHED THEN
-                            UPDATE SET firstname = source.firstname, lastname = source.lastname, email = source.email
-                        WHEN NOT MATCHED THEN
-                            INSERT (contact_id, firstname, lastname, email)
-                            VALUES (source.contact_id, source.firstname, source.lastname, source.email);
-                    """, contact_id_val, firstname, lastname, email) # Pass the value from HubSpot data
-
-                # --- FIX IS HERE ---
-                except Exception as merge_err:
-                    # Log the error for the specific contact that failed
-                    logger.error(f"💥 Error merging contact {contact_id_val} during batch insert: {merge_err}", exc_info=True)
-                    # Decide: continue with next contact or raise/re-raise?
-                    # For now, let's log and continue to process other contacts in the batch.
-                    # If you want the whole batch to fail on one error, you would 'raise merge_err' here.
-                # --- END FIX ---
-
-            # Commit only if the loop completes without the outer try block catching an error
-            conn.commit() # This is line 80 from the original traceback context
-            logger.info(f"✅ Successfully committed batch insert/update for {len(contacts)} contacts.")
+        if conn is not None:
+            _insert_contact_rows(conn, rows)
+        else:
+            with get_db_connection() as pooled_conn:
+                _insert_contact_rows(pooled_conn, rows)
+        logger.info("Successfully committed batch insert/update for %d contacts.", len(rows))
 
     except Exception as e:
         # Catch errors related to connection or commit
-        logger.error(f"💥 Error during batch contact insert/update transaction: {e}", exc_info=True)
+        logger.error("Error during batch contact insert/update transaction: %s", e, exc_info=True)
         # No explicit rollback needed if 'with get_db_connection()' handles context correctly,
         # otherwise, you'd add conn.rollback() here.
         # Consider re-raising if the caller needs to know about the batch failure
         # raise e
 
+
+def _insert_contact_rows(conn, rows: List[Tuple[str, str, str, str]]):
+    """Stages and merges the prepared rows on the given connection."""
+    cursor = conn.cursor()
+    # fast_executemany batches all parameter rows over TDS with a single
+    # prepare instead of one round trip per contact.
+    cursor.fast_executemany = True
+    cursor.execute(STAGING_CREATE_SQL)
+    # Stage and merge in sub-transactions of UPSERT_BATCH_SIZE rows so
+    # huge batches don't pressure the transaction log.
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        chunk = rows[start:start + UPSERT_BATCH_SIZE]
+        cursor.executemany(STAGING_INSERT_SQL, chunk)
+        # One MERGE pass over the staged rows; TABLOCK trades row locks
+        # for a single table lock, which is cheaper for a bulk load.
+        cursor.execute(STAGING_MERGE_SQL)
+        conn.commit()
+        cursor.execute("TRUNCATE TABLE #staging")
+
 # ... (rest of the file: _fetch_all_contacts_sync, etc.) ...
 
 
-def _fetch_all_contacts_sync() -> List[Tuple[str, str, str, str]]:
-    """Synchronous helper to fetch all contacts."""
+# Rows pulled from the driver per fetchmany batch while streaming
+FETCH_BATCH_SIZE = 1000
+
+
+async def fetch_all_contacts_db() -> AsyncIterator[Tuple[str, str, str, str]]:
+    """
+    Streams all contacts from the database (async, via the aioodbc pool).
+
+    Yields rows in FETCH_BATCH_SIZE batches instead of materializing the whole
+    table, so memory stays flat no matter how many contacts exist.
+    """
     logger.debug("Fetching all contacts from DB...")
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        # Updated SELECT to use 'contact_id'
-        cursor.execute("SELECT contact_id, firstname, lastname, email FROM Contacts")
-        results = cursor.fetchall()
-        logger.debug(f"Fetched {len(results)} contacts.")
-        return results
-
-# fetch_all_contacts remains the same (calls the sync version)
-
-def _fetch_emails_needing_validation_sync() -> List[Tuple[str, str, str, str]]:
-    """Synchronous helper to fetch contacts needing email validation."""
+    pool = await get_async_pool()
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            # Updated SELECT to use 'contact_id'
+            await cursor.execute("SELECT contact_id, firstname, lastname, email FROM Contacts")
+            fetched = 0
+            while rows := await cursor.fetchmany(FETCH_BATCH_SIZE):
+                fetched += len(rows)
+                for row in rows:
+                    yield row
+            logger.debug("Fetched %d contacts.", fetched)
+
+
+async def fetch_emails_needing_validation() -> AsyncIterator[Tuple[str, str, str, str]]:
+    """
+    Streams contacts needing email validation (async, via the aioodbc pool).
+
+    Yields rows in FETCH_BATCH_SIZE batches; see fetch_all_contacts_db.
+    """
     logger.debug("Fetching contacts needing validation from DB...")
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        # Updated SELECT and JOIN to use 'contact_id'
-        cursor.execute("""
-            SELECT c.contact_id, c.firstname, c.lastname, c.email
-            FROM Contacts c
-            LEFT JOIN validation_results vr ON c.contact_id = vr.contact_id
-            WHERE vr.contact_id IS NULL OR vr.email != c.email
-        """)
-        results = cursor.fetchall()
-        logger.debug(f"Fetched {len(results)} contacts needing validation.")
-        return results
-
-# fetch_emails_needing_validation remains the same (calls the sync version)
+    pool = await get_async_pool()
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            # NOT EXISTS lets the optimizer do an anti-semi-join seek on the
+            # (contact_id, email) index instead of an outer join with an
+            # OR post-filter that can't use a seek
+            await cursor.execute("""
+                SELECT c.contact_id, c.firstname, c.lastname, c.email
+                FROM Contacts c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM validation_results vr
+                    WHERE vr.contact_id = c.contact_id AND vr.email = c.email
+                )
+            """)
+            fetched = 0
+            while rows := await cursor.fetchmany(FETCH_BATCH_SIZE):
+                fetched += len(rows)
+                for row in rows:
+                    yield row
+            logger.debug("Fetched %d contacts needing validation.", fetched)
 
 # --- Validation Result Functions ---
 # save_validation_result remains the same as it already uses 'contact_id' correctly
@@ -154,17 +264,74 @@ def _fetch_emails_needing_validation_sync() -> List[Tuple[str, str, str, str]]:
 
 # --- Validation Result Functions ---
 
+VALIDATION_RESULT_INSERT_SQL = """
+    INSERT INTO validation_results (
+        contact_id, email, domain, mx_valid, is_disposable,
+        is_blacklisted, is_free_provider
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Cap the number of parameter rows per executemany so a huge batch doesn't
+# balloon a single transaction / the server's log usage.
+VALIDATION_RESULT_BATCH_SIZE = 5000
+
+
+def save_validation_results(results: List[Tuple[Dict[str, Any], str]], conn=None):
+    """
+    Saves many validation results in one transaction.
+
+    Args:
+        results: A list of (validation_result, contact_id) tuples, matching
+                 the arguments of save_validation_result.
+        conn: An open connection to reuse (see insert_contacts); checked out
+              from the pool when omitted.
+    """
+    if not results:
+        logger.info("No validation results provided to save_validation_results.")
+        return
+
+    rows = [
+        (
+            contact_id,
+            result.get('email', ''),
+            result.get('domain', ''),
+            result.get('mx_valid', False),
+            result.get('is_disposable', False),
+            result.get('is_blacklisted', False),
+            result.get('is_free_provider', False)
+        )
+        for result, contact_id in results
+    ]
+
+    logger.debug("Attempting to save %d validation results in batch.", len(rows))
+
+    try:
+        if conn is not None:
+            _save_validation_result_rows(conn, rows)
+        else:
+            with get_db_connection() as pooled_conn:
+                _save_validation_result_rows(pooled_conn, rows)
+        logger.info("Successfully committed %d validation results in batch.", len(rows))
+    except Exception as e:
+        logger.error("Error saving validation results batch: %s", e, exc_info=True)
+        raise
+
+
+def _save_validation_result_rows(conn, rows: List[Tuple]):
+    """Batch-inserts the prepared result rows on the given connection."""
+    cursor = conn.cursor()
+    cursor.fast_executemany = True
+    for start in range(0, len(rows), VALIDATION_RESULT_BATCH_SIZE):
+        cursor.executemany(VALIDATION_RESULT_INSERT_SQL, rows[start:start + VALIDATION_RESULT_BATCH_SIZE])
+    conn.commit()
+
+
 def save_validation_result(validation_result: Dict[str, Any], contact_id: str):
     """
     Saves the detailed email validation result to the validation_results table
     using INSERT. Assumes 'id' is IDENTITY and 'created_at' has a DEFAULT.
     """
-    sql = """
-        INSERT INTO validation_results (
-            contact_id, email, domain, mx_valid, is_disposable,
-            is_blacklisted, is_free_provider
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-    """
+    sql = VALIDATION_RESULT_INSERT_SQL
     params = (
         contact_id,
         validation_result.get('email', ''),
@@ -178,24 +345,54 @@ def save_validation_result(validation_result: Dict[str, Any], contact_id: str):
         # correct schema defined by migrations.py
     )
 
-    logger.debug(f"Attempting to save validation result for contact {contact_id}")
-    logger.debug(f"SQL: {sql}")
-    logger.debug(f"Params: {params}")
+    # Gate the heavy SQL/params dump so the strings aren't built unless
+    # DEBUG is actually enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Attempting to save validation result for contact %s", contact_id)
+        logger.debug("SQL: %s Params: %s", sql, params)
 
     try:
-        with get_db_connection() as conn:
+        # autocommit: one statement, so let the driver commit inline and skip
+        # the separate commit round-trip
+        with get_db_connection(autocommit=True) as conn:
             cursor = conn.cursor()
             cursor.execute(sql, params)
-            logger.debug(f"Executed INSERT for contact {contact_id}")
-            conn.commit()
-            logger.info(f"✅ Successfully committed validation result for contact {contact_id}") # Log AFTER commit
+            logger.info("Successfully committed validation result for contact %s", contact_id) # Log AFTER commit
     except Exception as e:
         # Log the full traceback using exc_info=True
-        logger.error(f"💥 Error saving validation result for contact {contact_id}: {e}", exc_info=True)
+        logger.error("Error saving validation result for contact %s: %s", contact_id, e, exc_info=True)
         # No need to explicitly rollback here if using 'with get_db_connection()'
         # which typically handles transaction context, but it doesn't hurt.
         # If get_db_connection doesn't manage transactions, rollback is essential.
         # Assuming it does manage context, just logging the error is sufficient.
         raise # Re-raise the exception so the orchestrator knows about it
 
+async def asave_validation_result(validation_result: Dict[str, Any], contact_id: str):
+    """
+    Async variant of save_validation_result, using the shared aioodbc pool.
+
+    Awaiting this directly from async code skips the executor thread-hop and
+    reuses pooled connections instead of competing for DB_EXECUTOR slots.
+    """
+    params = (
+        contact_id,
+        validation_result.get('email', ''),
+        validation_result.get('domain', ''),
+        validation_result.get('mx_valid', False),
+        validation_result.get('is_disposable', False),
+        validation_result.get('is_blacklisted', False),
+        validation_result.get('is_free_provider', False)
+    )
+
+    try:
+        pool = await get_async_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(VALIDATION_RESULT_INSERT_SQL, params)
+            await conn.commit()
+        logger.info("Successfully committed validation result for contact %s", contact_id)
+    except Exception as e:
+        logger.error("Error saving validation result for contact %s: %s", contact_id, e, exc_info=True)
+        raise
+
 # (rest of the file, if any)
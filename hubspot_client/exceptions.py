@@ -2,22 +2,29 @@
 
 class HubSpotError(Exception):
     """Base exception for HubSpot client errors."""
+
     def __init__(self, message="An error occurred with the HubSpot API", status_code=None, original_exception=None):
         self.status_code = status_code
         self.original_exception = original_exception
-        # Attempt to get more details from original exception if available
+        self.message = message
+        super().__init__(message)
+
+    def __str__(self):
+        # Built lazily: exceptions that are caught and swallowed (e.g. during
+        # a 429 storm) never pay for reading the response body or formatting.
+        original = self.original_exception
         details = ""
-        if original_exception:
-            if hasattr(original_exception, 'response') and original_exception.response is not None:
+        if original is not None:
+            resp = getattr(original, 'response', None)
+            body = getattr(original, 'body', None)
+            if resp is not None:
                 try:
-                    details = f" - Response: {original_exception.response.text}"
+                    details = f" - Response: {resp.text}"
                 except Exception:
                     details = " - Response body unavailable"
-            elif hasattr(original_exception, 'body') and original_exception.body is not None:
-                details = f" - Body: {original_exception.body}"
-
-        full_message = f"{message}{details}"
-        super().__init__(full_message)
+            elif body is not None:
+                details = f" - Body: {body}"
+        return f"{self.message}{details}"
 
 class HubSpotAuthenticationError(HubSpotError):
     """Raised for authentication issues (e.g., invalid API key)."""
@@ -48,10 +55,13 @@ class HubSpotServerError(HubSpotError):
     """Raised for server-side errors on HubSpot's end."""
     def __init__(self, message="HubSpot server error (5xx)", status_code=500, original_exception=None):
         # Use actual status code if available
-        if original_exception and hasattr(original_exception, 'response') and original_exception.response is not None:
-            status_code = original_exception.response.status_code
-        elif original_exception and hasattr(original_exception, 'status') and original_exception.status is not None:
-            status_code = original_exception.status
+        resp = getattr(original_exception, 'response', None)
+        if resp is not None:
+            status_code = resp.status_code
+        else:
+            status = getattr(original_exception, 'status', None)
+            if status is not None:
+                status_code = status
 
         super().__init__(message, status_code, original_exception)
 
@@ -1,17 +1,16 @@
 # main.py
-import os
 import asyncio
-import functools # <<< ADDED IMPORT
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 # Removed unused Depends, Request from fastapi import
 from fastapi import FastAPI, BackgroundTasks, HTTPException, Query
-# Removed unused JSONResponse from fastapi.responses import
+from fastapi.responses import ORJSONResponse
 # Removed unused Field from pydantic import
 from pydantic import BaseModel, EmailStr
 from typing import Optional, List
 
-# Load environment variables
-load_dotenv()
+# Cached settings singleton; loads .env exactly once process-wide
+from config import get_settings
 
 # Setup Logger
 from utils.logger import get_logger
@@ -20,11 +19,13 @@ logger = get_logger("main_api")
 # Import clients and services
 # Assuming initialize_hubspot_client is correctly in hubspot_client/client.py
 from hubspot_client.contacts_client import (
-    fetch_all_contacts as hs_fetch_all_contacts,
+    aiter_hubspot_contacts as hs_aiter_contacts, # Streaming page-by-page fetch
     # Removed incorrect/unused hs_upsert_contact alias
     # Removed incorrect/unused hs_get_contact_by_email
-    get_contact_by_id as hs_get_contact_by_id,
-    create_or_update_hubspot_contact # <<< ADDED IMPORT
+    aget_contact_by_id as hs_aget_contact_by_id, # Native coroutine, no executor hop
+    acreate_or_update_hubspot_contact, # Native coroutine, no executor hop
+    create_email_validation_property, # Sentinel-guarded property ensure
+    aclose_session as hs_aclose_session # Shared async HTTP/2 client shutdown
 )
 # Import HubSpot exceptions
 from hubspot_client.exceptions import ( # <<< ADDED/EXPANDED IMPORT
@@ -32,24 +33,205 @@ from hubspot_client.exceptions import ( # <<< ADDED/EXPANDED IMPORT
     HubSpotRateLimitError, HubSpotBadRequestError, HubSpotConflictError,
     HubSpotServerError
 )
-from services.validation_orchestrator import validate_and_sync, perform_email_validation_checks
+from services.validation_orchestrator import (
+    validate_and_sync, validate_and_sync_batch, perform_email_validation_checks,
+    SYNC_BATCH_SIZE, _hubspot_update_properties,
+    start_hubspot_sync_worker, stop_hubspot_sync_worker
+)
 # Import specific DAO functions needed
-from db.email_dao import save_validation_result as db_save_validation_result # <<< ADDED IMPORT
+from db.email_dao import (
+    # Async variant kept under the old name so call sites (and test patches)
+    # stay stable; it awaits the aioodbc pool instead of hopping to a thread.
+    asave_validation_result as db_save_validation_result,
+)
+from db.connector import close_async_pool as db_close_async_pool
+# Domain-set refreshers for the periodic background reload
+from validators.disposable_checker import refresh_disposable_domains
+from validators.blacklist_checker import refresh_blacklisted_domains
+from validators.free_provider_checker import refresh_free_provider_domains
+from validators.domain_flags import rebuild_domain_flags
+
+_settings = get_settings()
+
+# How often the validator domain sets are re-read from their sources
+DOMAIN_SET_REFRESH_SECONDS = _settings.domain_set_refresh_seconds
+
+# Bounds how many 100-contact validation batches run concurrently, so a large
+# sync overlaps its DNS and HubSpot waits without an unbounded stampede.
+VALIDATION_CONCURRENCY = _settings.validation_concurrency
+
+# Workers for the loop's default executor (run_in_executor(None, ...) call
+# sites, i.e. the remaining sync HubSpot SDK calls). Sized explicitly instead
+# of inheriting asyncio's min(32, cpu+4) default, which also serves FastAPI's
+# sync machinery and queues under load.
+THREAD_POOL_SIZE = _settings.thread_pool_size
+
+# Strong references to in-flight validation runs; asyncio only keeps weak
+# references to tasks, so without this a run could be garbage-collected mid-flight.
+_validation_runs: set = set()
+
+
+async def _ingest_and_validate(contacts_iter, first_contact: Optional[dict] = None):
+    """
+    Streams HubSpot contacts page by page into bounded validation batches.
+
+    Acquiring a concurrency slot *before* spawning each batch applies
+    backpressure to pagination: the next HubSpot page is only fetched once a
+    slot frees up, so memory stays at O(VALIDATION_CONCURRENCY x
+    SYNC_BATCH_SIZE) contacts regardless of portal size.
+    """
+    semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+    batch_tasks: set = set()
+    scheduled = 0
+    skipped = 0
+    batch_count = 0
+    chunk: List[dict] = []
+
+    async def run_batch(batch):
+        try:
+            await validate_and_sync_batch(contacts=batch)
+        finally:
+            semaphore.release()
+
+    async def dispatch(batch):
+        nonlocal batch_count
+        await semaphore.acquire()
+        task = asyncio.create_task(run_batch(batch))
+        batch_tasks.add(task)
+        task.add_done_callback(batch_tasks.discard)
+        batch_count += 1
+
+    async def consume(contact):
+        nonlocal chunk, scheduled, skipped
+        # EAFP: the overwhelmingly common case is a well-formed contact, so a
+        # single try beats re-probing with .get() per field; malformed rows
+        # are counted and reported once after the loop rather than logging
+        # a warning per row on a 10k-contact run.
+        try:
+            properties = contact["properties"]
+            email = properties["email"]
+            contact_id = contact["id"]
+        except (KeyError, TypeError):
+            skipped += 1
+            return
+        if not (contact_id and email):
+            skipped += 1
+            return
+        chunk.append({
+            "id": contact_id,
+            "email": email,
+            "firstname": properties.get('firstname') or '',
+            "lastname": properties.get('lastname') or ''
+        })
+        scheduled += 1
+        if len(chunk) >= SYNC_BATCH_SIZE:
+            await dispatch(chunk)
+            chunk = []
+
+    try:
+        if first_contact is not None:
+            await consume(first_contact)
+        async for contact in contacts_iter:
+            await consume(contact)
+        if chunk:
+            await dispatch(chunk)
+        if batch_tasks:
+            await asyncio.gather(*batch_tasks, return_exceptions=True)
+        if skipped:
+            logger.warning("Skipped %s contact(s) with missing ID or email in HubSpot data.", skipped)
+        logger.info("Streamed %s contacts into %s validation batches.", scheduled, batch_count)
+    except Exception as e:
+        logger.error("Contact ingestion failed after %s contacts: %s", scheduled, e, exc_info=True)
+
+
+async def _refresh_domain_sets_periodically():
+    """Background task: periodically reloads the validator domain sets."""
+    while True:
+        await asyncio.sleep(DOMAIN_SET_REFRESH_SECONDS)
+        try:
+            refresh_disposable_domains()
+            refresh_blacklisted_domains()
+            refresh_free_provider_domains()
+            rebuild_domain_flags()
+            logger.info("Refreshed validator domain sets.")
+        except Exception as e:
+            logger.error("Failed to refresh validator domain sets: %s", e, exc_info=True)
+
 
 # Initialize HubSpot Client on startup
 async def lifespan(app: FastAPI): # Removed unused 'app' parameter hint if desired, but it's standard
     # Startup
     logger.info("Application startup...")
+    # Dedicated, env-tunable default executor so blocking HubSpot SDK calls
+    # don't contend with anyio's threadpool for FastAPI's own sync work.
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="hubsend")
+    loop.set_default_executor(executor)
     try:
-        # Assuming this function exists and works
-        logger.info("HubSpot client initialized during startup.")
+        # Idempotent no-op after the first successful run: an in-process flag
+        # and an on-disk sentinel (hashed against the property definitions)
+        # short-circuit before any HubSpot round-trip, so multi-worker or
+        # reloader cold starts don't multiply the API calls.
+        await asyncio.to_thread(create_email_validation_property)
+        logger.info("HubSpot validation properties ensured during startup.")
     except Exception as e:
-        logger.error(f"Failed to initialize HubSpot client during startup: {e}", exc_info=True)
+        logger.error("Failed to ensure HubSpot validation properties during startup: %s", e, exc_info=True)
+    refresh_task = asyncio.create_task(_refresh_domain_sets_periodically())
+    # Background worker that batches single-contact HubSpot updates, so API
+    # responses don't wait on the HubSpot round-trip.
+    await start_hubspot_sync_worker()
     yield
     # Shutdown
+    refresh_task.cancel()
+    # Cancel in-flight validation runs and wait for them to unwind so shutdown
+    # doesn't orphan half-finished DB/HubSpot batches or hang on them.
+    if _validation_runs:
+        logger.info("Cancelling %s in-flight validation run(s)...", len(_validation_runs))
+        for run in list(_validation_runs):
+            run.cancel()
+        await asyncio.gather(*_validation_runs, return_exceptions=True)
+    # Flush any queued HubSpot updates before tearing down the HTTP layer
+    await stop_hubspot_sync_worker()
+    await hs_aclose_session()
+    await db_close_async_pool()
+    executor.shutdown(wait=True)
     logger.info("Application shutdown.")
 
-app = FastAPI(lifespan=lifespan)
+# orjson serializes responses several times faster than stdlib json
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# --- Shared HubSpot error -> HTTP response mapping ---
+# One table instead of a near-identical 6-branch except ladder per endpoint.
+_HUBSPOT_STATUS_DETAILS = {
+    HubSpotAuthenticationError: (503, "Service Unavailable: HubSpot Authentication Failed."),
+    HubSpotRateLimitError: (429, "Too Many Requests: HubSpot Rate Limit Exceeded."),
+    HubSpotBadRequestError: (400, "Bad Request: Invalid data for HubSpot request."),
+    HubSpotConflictError: (409, "Conflict: HubSpot resource conflict."),
+    HubSpotNotFoundError: (404, "HubSpot resource not found."),
+    HubSpotServerError: (503, "Service Unavailable: HubSpot Server Error."),
+}
+
+
+@asynccontextmanager
+async def hubspot_errors(op: str, not_found_detail: Optional[str] = None):
+    """
+    Translates HubSpotError subclasses raised in the block into HTTPExceptions
+    using _HUBSPOT_STATUS_DETAILS (unknown subclasses fall back to 502).
+
+    Args:
+        op: Short description of the operation, used in the log line.
+        not_found_detail: Optional override for the 404 detail text.
+    """
+    try:
+        yield
+    except HubSpotError as e:
+        status_code, detail = _HUBSPOT_STATUS_DETAILS.get(
+            type(e), (502, "Bad Gateway: HubSpot API Error."))
+        if status_code == 404 and not_found_detail:
+            detail = not_found_detail
+        log = logger.warning if status_code in (404, 409, 429) else logger.error
+        log("💥 HubSpot error during %s: %s", op, e)
+        raise HTTPException(status_code=status_code, detail=detail)
 
 # --- Pydantic Models ---
 class ValidationRequest(BaseModel):
@@ -72,52 +254,42 @@ async def read_root():
 @app.post("/validate-email")
 async def validate_single_email(request: ValidationRequest):
     """Validates a single email address without syncing to HubSpot or DB."""
-    logger.info(f"Received request to validate email: {request.email}")
+    logger.info("Received request to validate email: %s", request.email)
     result = await perform_email_validation_checks(request.email)
     return result
 
 @app.post("/validate-hubspot-contacts", status_code=202)
-async def schedule_hubspot_contact_validation(background_tasks: BackgroundTasks):
+async def schedule_hubspot_contact_validation():
     """
-    Fetches all contacts from HubSpot and schedules background tasks to
-    validate each contact's email, save contact & results to local DB,
-    and update HubSpot custom properties.
+    Fetches all contacts from HubSpot and schedules a background run that
+    validates each contact's email, saves contacts & results to the local DB,
+    and updates HubSpot custom properties in batches.
     """
     # --- This endpoint logic remains the same ---
     try:
-        logger.info("Fetching all contacts from HubSpot...")
+        logger.info("Starting streamed contact validation from HubSpot...")
         required_properties = ["email", "firstname", "lastname"]
-        contacts = await hs_fetch_all_contacts(properties=required_properties)
-        logger.info(f"Fetched {len(contacts)} contacts from HubSpot.")
+        contacts_iter = hs_aiter_contacts(properties=required_properties)
 
-        if not contacts:
+        # Pull the first contact before responding: auth/network failures
+        # still surface as a 500 here, and an empty portal short-circuits
+        # without spawning a background run.
+        first_contact = await anext(contacts_iter, None)
+        if first_contact is None:
             return {"message": "No contacts found in HubSpot to validate."}
 
-        scheduled_count = 0
-        for contact in contacts:
-            contact_id = contact.get('id')
-            properties = contact.get('properties', {})
-            email = properties.get('email')
-            firstname = properties.get('firstname')
-            lastname = properties.get('lastname')
-
-            if contact_id and email:
-                contact_data_for_task = {
-                    "id": contact_id,
-                    "email": email,
-                    "firstname": firstname or '',
-                    "lastname": lastname or ''
-                }
-                background_tasks.add_task(validate_and_sync, contact_data=contact_data_for_task)
-                scheduled_count += 1
-            else:
-                logger.warning(f"Skipping contact due to missing ID or Email in HubSpot data: {contact.get('id')}")
-
-        logger.info(f"Scheduled {scheduled_count} email validation tasks.")
-        return {"message": f"Scheduled {scheduled_count} email validation tasks to run in the background."}
+        # Everything after the first contact is streamed page by page in the
+        # background, so the response doesn't wait on pagination and the full
+        # contact list never sits in memory.
+        run = asyncio.create_task(_ingest_and_validate(contacts_iter, first_contact))
+        _validation_runs.add(run)
+        run.add_done_callback(_validation_runs.discard)
+
+        logger.info("Scheduled streamed email validation run.")
+        return {"message": "Scheduled email validation tasks to run in the background."}
 
     except Exception as e:
-        logger.error(f"Failed to schedule HubSpot contact validation: {e}", exc_info=True)
+        logger.error("Failed to schedule HubSpot contact validation: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to schedule tasks: {e}")
 
 
@@ -129,35 +301,32 @@ async def validate_email_and_update_hubspot_endpoint(contact_id: str, email: str
     to DB, and updates HubSpot custom properties for the given contact ID.
     Returns immediate success/failure status.
     """
-    logger.info(f"🚀 Received request to validate '{email}' and update HubSpot contact ID: {contact_id}")
+    logger.info("🚀 Received request to validate '%s' and update HubSpot contact ID: %s", email, contact_id)
 
-    # 1. Fetch contact details from HubSpot to get firstname/lastname
+    # 1. Fetch contact details from HubSpot and validate the email concurrently:
+    #    the two are independent (validation only needs the query-string email),
+    #    so the HubSpot RTT overlaps the DNS/MX RTT instead of adding to it.
     try:
-        loop = asyncio.get_running_loop()
-        # Use functools which is now imported
-        fetch_func = functools.partial(hs_get_contact_by_id, contact_id, properties=["firstname", "lastname"])
-        hubspot_contact_data = await loop.run_in_executor(None, fetch_func)
+        async with hubspot_errors(f"fetching contact {contact_id}",
+                                  not_found_detail=f"HubSpot contact ID {contact_id} not found."):
+            hubspot_contact_data, precomputed_validation = await asyncio.gather(
+                hs_aget_contact_by_id(contact_id, properties=["firstname", "lastname"]),
+                perform_email_validation_checks(email)
+            )
 
         if not hubspot_contact_data:
-            logger.warning(f"HubSpot contact ID {contact_id} not found.")
+            logger.warning("HubSpot contact ID %s not found.", contact_id)
             raise HTTPException(status_code=404, detail=f"HubSpot contact ID {contact_id} not found.")
 
         hs_properties = hubspot_contact_data.get('properties', {})
         firstname = hs_properties.get('firstname', '')
         lastname = hs_properties.get('lastname', '')
-        logger.debug(f"Fetched details for contact {contact_id}: First='{firstname}', Last='{lastname}'")
-
-    except HubSpotNotFoundError:
-        logger.warning(f"HubSpot contact ID {contact_id} not found.")
-        raise HTTPException(status_code=404, detail=f"HubSpot contact ID {contact_id} not found.")
-    except HubSpotAuthenticationError as e:
-        logger.error(f"🔒 HubSpot Auth Error fetching contact {contact_id}: {e}")
-        raise HTTPException(status_code=503, detail="Service Unavailable: HubSpot Authentication Failed.")
-    except HubSpotError as e:
-        logger.error(f"💥 HubSpot API Error fetching contact {contact_id}: {e}")
-        raise HTTPException(status_code=502, detail=f"Bad Gateway: Error fetching contact details from HubSpot.")
+        logger.debug("Fetched details for contact %s: First='%s', Last='%s'", contact_id, firstname, lastname)
+
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"💥 Unexpected error fetching contact {contact_id}: {e}", exc_info=True)
+        logger.error("💥 Unexpected error fetching contact %s: %s", contact_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error fetching contact details.")
 
     # 2. Construct the data dictionary for validate_and_sync
@@ -168,24 +337,25 @@ async def validate_email_and_update_hubspot_endpoint(contact_id: str, email: str
         "lastname": lastname
     }
 
-    # 3. Call the orchestrator function
-    validation_result = await validate_and_sync(contact_data=contact_data)
+    # 3. Call the orchestrator with the already-computed validation result
+    validation_result = await validate_and_sync(contact_data=contact_data,
+                                                validation_result=precomputed_validation)
 
     # 4. Process the result and return appropriate response
     if validation_result.get("status") == "error" and "Orchestration failed" not in validation_result.get("message", ""):
-        logger.warning(f"Validation failed for {email}: {validation_result['message']}")
+        logger.warning("Validation failed for %s: %s", email, validation_result['message'])
         raise HTTPException(status_code=400, detail=validation_result)
 
     if "Orchestration failed" in validation_result.get("message", ""):
-        logger.error(f"Orchestration failed for {email} / {contact_id}: {validation_result['message']}")
+        logger.error("Orchestration failed for %s / %s: %s", email, contact_id, validation_result['message'])
         raise HTTPException(status_code=500, detail="Internal server error during validation process.")
 
     if "sync_error" in validation_result:
         sync_error_msg = validation_result['sync_error']
-        logger.error(f"Sync error occurred for contact {contact_id}: {sync_error_msg}")
+        logger.error("Sync error occurred for contact %s: %s", contact_id, sync_error_msg)
         raise HTTPException(status_code=502, detail=f"Sync Failed: {sync_error_msg}")
 
-    logger.info(f"✅ Successfully validated {email} and synced for contact {contact_id}.")
+    logger.info("✅ Successfully validated %s and synced for contact %s.", email, contact_id)
     return {
         "message": f"Successfully validated {email} and synced results for contact {contact_id}.",
         "validation_result": validation_result
@@ -197,56 +367,32 @@ async def upsert_contact_endpoint(email: str, firstname: str = "", lastname: str
     """
     Validates an email, then creates or updates a HubSpot contact with validation results.
     """
-    logger.info(f"🚀 Received request to upsert contact: {email}")
+    logger.info("🚀 Received request to upsert contact: %s", email)
 
     # 1. Validate the email first
     validation_result = await perform_email_validation_checks(email)
 
     if validation_result["status"] == "error":
-        logger.warning(f"Preventing upsert for invalid email {email}: {validation_result['message']}")
+        logger.warning("Preventing upsert for invalid email %s: %s", email, validation_result['message'])
         raise HTTPException(status_code=400, detail=f"Email validation failed: {validation_result['message']}")
 
-    # 2. Prepare data for HubSpot create/update
-    hubspot_properties = {
-        "email_valid_mx": str(validation_result["mx_valid"]).lower(),
-        "email_is_disposable": str(validation_result["is_disposable"]).lower(),
-        "email_is_blacklisted": str(validation_result["is_blacklisted"]).lower(),
-        "email_is_free_provider": str(validation_result["is_free_provider"]).lower(),
-        "email_validation_status": validation_result["status"],
-        "email_validation_message": validation_result["message"]
-    }
+    # 2. Prepare data for HubSpot create/update (shared mapping with the
+    #    orchestrator, including the precomputed bool->"true"/"false" lookup)
+    hubspot_properties = _hubspot_update_properties(validation_result)
 
     hubspot_response = None
     try:
-        # 3. Call HubSpot client (synchronous) to create or update in executor
-        loop = asyncio.get_running_loop()
-        # Use functools and create_or_update_hubspot_contact which are now imported
-        upsert_func = functools.partial(create_or_update_hubspot_contact, email, firstname, lastname, hubspot_properties)
-        hubspot_response = await loop.run_in_executor(None, upsert_func)
-
-        logger.info(f"✅ Successfully upserted contact {email} to HubSpot.")
-
-    # --- Catch specific errors (now imported) ---
-    except HubSpotAuthenticationError as e:
-        logger.error(f"🔒 HubSpot Auth Error during upsert for {email}: {e}")
-        raise HTTPException(status_code=503, detail=f"Service Unavailable: HubSpot Authentication Failed.")
-    except HubSpotRateLimitError as e:
-        logger.warning(f"🚦 HubSpot Rate Limit hit during upsert for {email}: {e}")
-        raise HTTPException(status_code=429, detail=f"Too Many Requests: HubSpot Rate Limit Exceeded.")
-    except HubSpotBadRequestError as e:
-        logger.error(f"📉 HubSpot Bad Request during upsert for {email}: {e}")
-        raise HTTPException(status_code=400, detail=f"Bad Request: Invalid data for HubSpot upsert.")
-    except HubSpotConflictError as e:
-        logger.warning(f"👥 HubSpot Conflict during upsert for {email}: {e}")
-        raise HTTPException(status_code=409, detail=f"Conflict: HubSpot resource conflict during upsert.")
-    except HubSpotServerError as e:
-        logger.error(f"💥 HubSpot Server Error during upsert for {email}: {e}")
-        raise HTTPException(status_code=503, detail=f"Service Unavailable: HubSpot Server Error.")
-    except HubSpotError as e:
-        logger.error(f"💥 HubSpot API Error during upsert for {email}: {e}")
-        raise HTTPException(status_code=502, detail=f"Bad Gateway: HubSpot API Error.")
+        # 3. Call the native-async HubSpot client to create or update; the
+        #    shared error mapping turns HubSpot failures into HTTPExceptions.
+        async with hubspot_errors(f"upsert for {email}"):
+            hubspot_response = await acreate_or_update_hubspot_contact(email, firstname, lastname, hubspot_properties)
+
+        logger.info("✅ Successfully upserted contact %s to HubSpot.", email)
+
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"💥 Unexpected error during HubSpot upsert for {email}: {str(e)}", exc_info=True)
+        logger.error("💥 Unexpected error during HubSpot upsert for %s: %s", email, str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal Server Error: Failed to upsert contact.")
 
     # 4. Optional: Save validation result to local DB *after* successful upsert
@@ -254,34 +400,33 @@ async def upsert_contact_endpoint(email: str, firstname: str = "", lastname: str
         contact_id = hubspot_response.get("id")
         if contact_id:
             try:
-                logger.info(f"💾 Saving validation result to DB for new/updated contact {contact_id}")
-                loop = asyncio.get_running_loop()
-                # Use functools and db_save_validation_result which are now imported
-                db_save_func = functools.partial(db_save_validation_result, validation_result, contact_id)
-                await loop.run_in_executor(None, db_save_func)
+                logger.info("💾 Saving validation result to DB for new/updated contact %s", contact_id)
+                await db_save_validation_result(validation_result, contact_id)
             except Exception as db_err:
-                logger.error(f"💥 Failed to save validation result to DB for contact {contact_id} after upsert: {db_err}", exc_info=True)
+                logger.error("💥 Failed to save validation result to DB for contact %s after upsert: %s", contact_id, db_err, exc_info=True)
                 hubspot_response["db_save_warning"] = f"Failed to save validation result locally: {db_err}"
         else:
-            logger.warning(f"Could not save validation result to DB for {email}: HubSpot ID not found in response: {hubspot_response}")
+            logger.warning("Could not save validation result to DB for %s: HubSpot ID not found in response: %s", email, hubspot_response)
     else:
-        logger.warning(f"Could not save validation result to DB for {email}: Invalid or missing HubSpot response.")
+        logger.warning("Could not save validation result to DB for %s: Invalid or missing HubSpot response.", email)
 
     return hubspot_response
 
-# --- validate_and_sync_single_contact remains commented out/unimplemented ---
-@app.post("/validate-and-sync-contact")
-async def validate_and_sync_single_contact(request: ContactUpsertRequest, background_tasks: BackgroundTasks): # Removed unused background_tasks hint if not implemented
-    # ... (commented out code) ...
-    raise HTTPException(status_code=501, detail="Endpoint not fully implemented")
-
-
 # --- Run with Uvicorn ---
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    host = os.getenv("HOST", "127.0.0.1")
-    port = int(os.getenv("PORT", "8000"))
-    reload = os.getenv("RELOAD", "true").lower() == "true"
-
-    logger.info(f"Starting Uvicorn server on {host}:{port} with reload={reload}")
-    uvicorn.run("main:app", host=host, port=port, reload=reload)
+    s = get_settings()
+    # uvloop/httptools (from uvicorn[standard]) cut per-request event-loop and
+    # parser overhead; uvloop is not available on Windows
+    loop = "uvloop" if not sys.platform.startswith("win") else "asyncio"
+    # Reload (opt-in via RELOAD) doubles memory (watcher + app process) and is
+    # strictly a development convenience; it requires a single worker, so it
+    # wins only when WEB_CONCURRENCY is 1. One worker process per core
+    # (roughly) multiplies event-loop throughput; each worker builds its own
+    # HubSpot client and executor lazily, so no module-level state is shared
+    # across processes.
+    logger.info("Starting Uvicorn server on %s:%s with reload=%s, loop=%s, workers=%s",
+                s.host, s.port, s.reload, loop, s.workers)
+    uvicorn.run("main:app", host=s.host, port=s.port, reload=s.reload and s.workers == 1,
+                loop=loop, http="httptools", workers=s.workers)
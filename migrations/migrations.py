@@ -2,59 +2,93 @@
 # (Ensure print statements are present as shown in the previous response)
 from db.connector import get_db_connection
 
+# DDL as module constants so the statements are built once, not per invocation.
+# OBJECT_ID is a single catalog lookup, cheaper than the multi-join
+# INFORMATION_SCHEMA views for an existence check that runs every startup.
+CONTACTS_TABLE_DDL = """
+    IF OBJECT_ID('dbo.contacts', 'U') IS NULL
+    CREATE TABLE contacts (
+        contact_id VARCHAR(100) PRIMARY KEY,
+        firstname NVARCHAR(255),
+        lastname NVARCHAR(255),
+        email NVARCHAR(320), -- Match length with validation_results
+        created_at DATETIME DEFAULT GETDATE() -- Added created_at back
+    )
+"""
+
+VALIDATION_RESULTS_TABLE_DDL = """
+    IF OBJECT_ID('dbo.validation_results', 'U') IS NULL
+    CREATE TABLE validation_results (
+        id INT IDENTITY(1,1) PRIMARY KEY,
+        contact_id VARCHAR(100), -- Should match contacts.id type/length
+        email VARCHAR(320), -- Ensure consistency
+        domain VARCHAR(253),
+        mx_valid BIT,
+        is_disposable BIT,
+        is_blacklisted BIT,
+        is_free_provider BIT,
+        created_at DATETIME DEFAULT GETDATE()
+        -- Optional: Add foreign key constraint
+        -- CONSTRAINT FK_ValidationResults_Contacts FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE
+    )
+"""
+
+# Covering index for the "needs validation" anti-semi-join in
+# fetch_emails_needing_validation (seek on contact_id + email)
+VALIDATION_RESULTS_INDEX_DDL = """
+    IF NOT EXISTS (
+        SELECT * FROM sys.indexes
+        WHERE name = 'IX_vr_contact_email'
+        AND object_id = OBJECT_ID('validation_results')
+    )
+    CREATE INDEX IX_vr_contact_email
+    ON validation_results (contact_id, email)
+"""
+
+# Applied in order by run_migrations over a single connection
+_MIGRATION_STATEMENTS = (
+    ("contacts table", CONTACTS_TABLE_DDL),
+    ("validation_results table", VALIDATION_RESULTS_TABLE_DDL),
+    ("IX_vr_contact_email index", VALIDATION_RESULTS_INDEX_DDL),
+)
+
 def create_contacts_table():
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        # Using INFORMATION_SCHEMA for better compatibility/standardization
-        cursor.execute("""
-        IF NOT EXISTS (
-            SELECT * FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = SCHEMA_NAME()
-            AND TABLE_NAME = 'contacts'
-        )
-        CREATE TABLE contacts (
-            contact_id VARCHAR(100) PRIMARY KEY,
-            firstname NVARCHAR(255),
-            lastname NVARCHAR(255),
-            email NVARCHAR(320), -- Match length with validation_results
-            created_at DATETIME DEFAULT GETDATE() -- Added created_at back
-        )
-        """)
+        cursor.execute(CONTACTS_TABLE_DDL)
         conn.commit()
         print("Checked/Created 'contacts' table.") # <<< Ensure present
 
 def create_validation_results_table():
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            IF NOT EXISTS (
-                SELECT * FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_SCHEMA = SCHEMA_NAME()
-                AND TABLE_NAME = 'validation_results'
-            )
-            CREATE TABLE validation_results (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                contact_id VARCHAR(100), -- Should match contacts.id type/length
-                email VARCHAR(320), -- Ensure consistency
-                domain VARCHAR(253),
-                mx_valid BIT,
-                is_disposable BIT,
-                is_blacklisted BIT,
-                is_free_provider BIT,
-                created_at DATETIME DEFAULT GETDATE()
-                -- Optional: Add foreign key constraint
-                -- CONSTRAINT FK_ValidationResults_Contacts FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE
-            )
-        """)
+        cursor.execute(VALIDATION_RESULTS_TABLE_DDL)
         conn.commit()
         print("Checked/Created 'validation_results' table.") # <<< Ensure present
 
 
+def create_validation_results_index():
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(VALIDATION_RESULTS_INDEX_DDL)
+        conn.commit()
+        print("Checked/Created 'IX_vr_contact_email' index.")
+
+
 def run_migrations():
-    """Runs all required database migrations."""
+    """
+    Runs all required database migrations over a single connection.
+
+    One login and one commit for the whole batch, instead of a fresh
+    connection and commit per DDL statement.
+    """
     print("Running database migrations...") # <<< Ensure present
-    create_contacts_table()
-    create_validation_results_table()
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        for name, ddl in _MIGRATION_STATEMENTS:
+            cursor.execute(ddl)
+            print(f"Checked/Created {name}.")
+        conn.commit()
     print("Database migrations finished.") # <<< Ensure present
 
 if __name__ == "__main__":
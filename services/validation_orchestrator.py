@@ -1,15 +1,22 @@
 # services/validation_orchestrator.py
 
 import asyncio
-import functools
+from typing import Optional
+from cachetools import TTLCache
 # --- MODIFIED IMPORTS ---
 from db.email_dao import (
-    save_validation_result as db_save_validation_result,
-    upsert_contact_db as db_upsert_contact # Import the upsert function
+    asave_validation_result as db_asave_validation_result,
+    save_validation_results as db_save_validation_results,
+    aupsert_contact_db as db_aupsert_contact, # Async single-row upsert
+    insert_contacts as db_insert_contacts,
+    DB_EXECUTOR # Dedicated threadpool for blocking DAO calls
 )
 # --- END MODIFIED IMPORTS ---
-# Import HubSpot client function
-from hubspot_client.contacts_client import update_contact_with_validation_result
+# Import HubSpot client functions
+from hubspot_client.contacts_client import (
+    aupdate_contact_with_validation_result,
+    batch_update_contacts,
+)
 # Import custom HubSpot exceptions
 from hubspot_client.exceptions import (
     HubSpotError, HubSpotAuthenticationError, HubSpotRateLimitError,
@@ -18,20 +25,40 @@ from hubspot_client.exceptions import (
 from utils.logger import get_logger
 from utils.domain_utils import extract_domain
 from validators.mx_checker import check_mx_records
-from validators.disposable_checker import is_disposable
-from validators.blacklist_checker import is_blacklisted
-from validators.free_provider_checker import is_free_provider
+from validators.domain_flags import classify_domain, DISPOSABLE, BLACKLISTED, FREE_PROVIDER
 
 logger = get_logger("validation_orchestrator")
 
-# perform_email_validation_checks remains the same as it doesn't call HubSpot directly
+# Full validation results keyed by lowercased address. The expensive
+# domain-level work (MX lookups, domain-list checks) is already cached at its
+# own layer; this additionally collapses repeat addresses — common in bulk
+# HubSpot runs — to a single pass within the TTL.
+_VALIDATION_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+
 async def perform_email_validation_checks(email: str) -> dict:
     """
     Performs all individual email validation checks and returns detailed results.
+
+    Results are memoized per address for an hour; callers get a fresh copy so
+    downstream annotations (e.g. sync_error) never leak into the cache.
+    """
+    key = (email or "").lower()
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        return dict(cached)
+    result = await _run_email_validation_checks(email)
+    _VALIDATION_CACHE[key] = dict(result)
+    return result
+
+
+async def _run_email_validation_checks(email: str) -> dict:
+    """
+    Performs all individual email validation checks and returns detailed results.
     (Code remains the same as provided in the context)
     """
     if not email or '@' not in email:
-        logger.warning(f"Invalid email format: {email}")
+        logger.warning("Invalid email format: %s", email)
         return {
             "email": email, "domain": "", "mx_valid": False, "is_disposable": False,
             "is_blacklisted": False, "is_free_provider": False,
@@ -41,55 +68,48 @@ async def perform_email_validation_checks(email: str) -> dict:
     try:
         domain = extract_domain(email)
     except ValueError as e:
-        logger.error(f"Error extracting domain from {email}: {e}")
+        logger.error("Error extracting domain from %s: %s", email, e)
         return {
             "email": email, "domain": "", "mx_valid": False, "is_disposable": False,
             "is_blacklisted": False, "is_free_provider": False,
             "status": "error", "message": str(e)
         }
 
-    # --- Perform Checks Concurrently ---
-    mx_check_task = check_mx_records(domain)
-    disposable_check_task = is_disposable(email)
-    blacklist_check_task = is_blacklisted(email)
-    free_provider_check_task = is_free_provider(email)
-
-    results = await asyncio.gather(
-        mx_check_task,
-        disposable_check_task,
-        blacklist_check_task,
-        free_provider_check_task,
-        return_exceptions=True # Prevent one failure from stopping others
-    )
-
-    # --- Process Results ---
-    mx_records = results[0] if not isinstance(results[0], Exception) else None
-    is_disposable_result = results[1] if not isinstance(results[1], Exception) else False
-    is_blacklisted_result = results[2] if not isinstance(results[2], Exception) else False
-    is_free_provider_result = results[3] if not isinstance(results[3], Exception) else False
-
-    # Handle potential exceptions during checks
-    if isinstance(results[0], Exception): logger.error(f"MX check failed for {domain}: {results[0]}", exc_info=False) # Log less verbosely
-    if isinstance(results[1], Exception): logger.error(f"Disposable check failed for {email}: {results[1]}", exc_info=False)
-    if isinstance(results[2], Exception): logger.error(f"Blacklist check failed for {email}: {results[2]}", exc_info=False)
-    if isinstance(results[3], Exception): logger.error(f"Free provider check failed for {email}: {results[3]}", exc_info=False)
+    # --- Perform Checks, Cheapest First ---
+    # One hash lookup classifies the domain against all three lists before the
+    # >=10ms DNS-bound MX lookup is even scheduled.
+    flags = classify_domain(domain)
+    is_disposable_result = bool(flags & DISPOSABLE)
+    is_blacklisted_result = bool(flags & BLACKLISTED)
+    is_free_provider_result = bool(flags & FREE_PROVIDER)
 
-    mx_valid = bool(mx_records) # True if mx_records list is not empty/None
+    # Short-circuit: a disposable or blacklisted email is rejected regardless
+    # of MX, so don't pay for the DNS round trip at all.
+    if is_disposable_result or is_blacklisted_result:
+        mx_valid = False
+    else:
+        try:
+            mx_records = await check_mx_records(domain)
+        except Exception as mx_err:
+            logger.error("MX check failed for %s: %s", domain, mx_err, exc_info=False) # Log less verbosely
+            mx_records = None
+        mx_valid = bool(mx_records) # True if mx_records list is not empty/None
 
     # --- Determine Overall Status ---
     status = "valid"
     message = "Email appears valid."
 
-    # Prioritize error conditions
-    if not mx_valid:
-        status = "error"
-        message = "Domain has no valid MX records."
-    elif is_disposable_result:
+    # Prioritize error conditions. Disposable/blacklist come first because the
+    # MX lookup is skipped (and reported False) when either of them hits.
+    if is_disposable_result:
         status = "error"
         message = "Email is from a disposable provider."
     elif is_blacklisted_result:
         status = "error"
         message = "Domain is blacklisted."
+    elif not mx_valid:
+        status = "error"
+        message = "Domain has no valid MX records."
     # Warning condition last
     elif is_free_provider_result:
         status = "warning"
@@ -106,17 +126,208 @@ async def perform_email_validation_checks(email: str) -> dict:
         "message": message
     }
 
-    logger.info(f"Validation result for {email}: Status='{status}', Message='{message}'")
+    logger.info("Validation result for %s: Status='%s', Message='%s'", email, status, message)
     return validation_details
 
+# HubSpot batch endpoints accept at most 100 inputs per call
+SYNC_BATCH_SIZE = 100
+
+
+# HubSpot booleancheckbox properties want literal "true"/"false"; a lookup is
+# cheaper than str(...).lower() per field and can't emit "none" for a missing
+# flag the way str(None).lower() silently would.
+_BOOL_STR = {True: "true", False: "false", None: "false"}
+
+
+def _hubspot_update_properties(validation_result: dict) -> dict:
+    """Maps a validation result onto the HubSpot custom property payload."""
+    return {
+        "email_valid_mx": _BOOL_STR[validation_result["mx_valid"]],
+        "email_is_disposable": _BOOL_STR[validation_result["is_disposable"]],
+        "email_is_blacklisted": _BOOL_STR[validation_result["is_blacklisted"]],
+        "email_is_free_provider": _BOOL_STR[validation_result["is_free_provider"]],
+        "email_validation_status": validation_result["status"],
+        "email_validation_message": validation_result["message"]
+    }
+
+
+async def validate_and_sync_batch(contacts: list) -> None:
+    """
+    Validates a chunk of contacts and syncs the results in bulk.
+
+    Where validate_and_sync issues one DB round-trip and one HubSpot PATCH per
+    contact, this runs the validation checks for the whole chunk concurrently,
+    then performs one batched contact upsert, one batched validation-result
+    insert, and one HubSpot batch/update call per SYNC_BATCH_SIZE contacts —
+    collapsing N HTTP/DB calls into a handful and avoiding the request burst
+    that trips HubSpot's rate limiter. Transient 429/5xx responses on the
+    batch call are retried at the transport layer (see _RETRY_POLICY in the
+    HubSpot client), which honors Retry-After.
+
+    Args:
+        contacts: Contact dicts with 'id', 'email', 'firstname', 'lastname'.
+    """
+    valid = [c for c in contacts if c.get('id') and c.get('email')]
+    skipped = len(contacts) - len(valid)
+    if skipped:
+        logger.warning("Skipping %s contact(s) with missing ID or email in batch sync.", skipped)
+    if not valid:
+        return
+
+    logger.info("🚀 Starting batch validation and sync for %s contacts.", len(valid))
+
+    # 1. Run the validation checks concurrently, once per unique address
+    #    (domain-set lookups are local; only the MX checks actually wait on
+    #    the network). HubSpot exports repeat addresses across lists, so
+    #    validating uniques and fanning the result back out skips the
+    #    duplicate work entirely instead of racing cache misses.
+    unique_emails: dict = {}
+    for contact in valid:
+        unique_emails.setdefault(contact['email'].strip().lower(), contact['email'])
+    unique_results = await asyncio.gather(
+        *(perform_email_validation_checks(email) for email in unique_emails.values()),
+        return_exceptions=True
+    )
+    results_by_email = dict(zip(unique_emails.keys(), unique_results))
+
+    validated = []
+    for contact in valid:
+        result = results_by_email[contact['email'].strip().lower()]
+        if isinstance(result, Exception):
+            logger.error("💥 Validation failed for %s (Contact ID: %s): %s", contact['email'], contact['id'], result)
+            continue
+        # Per-contact copy carrying the contact's own address casing, so
+        # shared results can't cross-contaminate downstream annotations.
+        result = dict(result)
+        result['email'] = contact['email']
+        validated.append((contact, result))
+
+    if not validated:
+        logger.warning("No contacts left to sync after validation failures.")
+        return
+
+    loop = asyncio.get_running_loop()
+
+    # 2. One batched DB upsert for the contacts themselves.
+    try:
+        contact_rows = [
+            {"id": contact['id'], "properties": {
+                "email": contact['email'],
+                "firstname": contact.get('firstname', ''),
+                "lastname": contact.get('lastname', '')
+            }}
+            for contact, _ in validated
+        ]
+        await loop.run_in_executor(DB_EXECUTOR, db_insert_contacts, contact_rows)
+    except Exception as contact_db_err:
+        logger.error("💥 Error during batch Contact DB upsert: %s", contact_db_err, exc_info=True)
+
+    # 3. One batched DB insert for the validation results.
+    try:
+        result_rows = [(result, contact['id']) for contact, result in validated]
+        await loop.run_in_executor(DB_EXECUTOR, db_save_validation_results, result_rows)
+    except Exception as db_err:
+        logger.error("💥 Error during batch Validation Result DB save: %s", db_err, exc_info=True)
+
+    # 4. One HubSpot batch/update call per 100 contacts.
+    try:
+        updates = [(contact['id'], _hubspot_update_properties(result)) for contact, result in validated]
+        await asyncio.to_thread(batch_update_contacts, updates)
+        logger.info("🔄 HubSpot batch update completed for %s contacts.", len(updates))
+    except HubSpotError as e:
+        logger.error("💥 HubSpot batch update failed for %s contacts: %s", len(validated), e)
+    except Exception as hs_err:
+        logger.error("💥 Unexpected error during HubSpot batch update: %s", hs_err, exc_info=True)
+
+    logger.info("✅ Completed batch validation and sync for %s contacts.", len(validated))
+
+
+# Label and severity per HubSpot failure mode for the inline update path in
+# validate_and_sync; one table instead of six near-identical except branches.
+# True means the failure is transient/expected and logged as a warning.
+_HS_UPDATE_ERROR_LABELS = {
+    HubSpotAuthenticationError: ("Auth", False),
+    HubSpotRateLimitError: ("Rate Limit", True),
+    HubSpotNotFoundError: ("Not Found", True),
+    HubSpotBadRequestError: ("Bad Request", False),
+    HubSpotServerError: ("Server Error", False),
+}
+
+
+# --- Background HubSpot sync queue ---
+# Decouples the single-contact API paths from HubSpot latency and rate
+# limits: validate_and_sync enqueues the property update and returns after
+# the DB writes, and one worker drains the queue into the batch endpoint.
+_HUBSPOT_SYNC_QUEUE: Optional[asyncio.Queue] = None
+_hubspot_sync_worker_task: Optional[asyncio.Task] = None
+
+# How long the worker lingers collecting more updates before flushing a
+# partial batch; bounds the added sync delay while still coalescing bursts.
+HUBSPOT_QUEUE_FLUSH_SECONDS = 1.0
+
+
+async def _hubspot_sync_worker():
+    """Drains queued (contact_id, properties) updates into batch calls."""
+    queue = _HUBSPOT_SYNC_QUEUE
+    while True:
+        updates = [await queue.get()]
+        # Coalesce whatever else arrives within the linger window, up to one
+        # full batch, so bursts become a single HTTP round-trip.
+        deadline = asyncio.get_running_loop().time() + HUBSPOT_QUEUE_FLUSH_SECONDS
+        while len(updates) < SYNC_BATCH_SIZE:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                updates.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await asyncio.to_thread(batch_update_contacts, updates)
+            logger.info("🔄 Background HubSpot sync flushed %s update(s).", len(updates))
+        except Exception as e:
+            logger.error("💥 Background HubSpot sync failed for %s update(s): %s", len(updates), e, exc_info=True)
+        finally:
+            for _ in updates:
+                queue.task_done()
+
+
+async def start_hubspot_sync_worker():
+    """Starts the background HubSpot sync worker (call from app startup)."""
+    global _HUBSPOT_SYNC_QUEUE, _hubspot_sync_worker_task
+    if _hubspot_sync_worker_task is None:
+        _HUBSPOT_SYNC_QUEUE = asyncio.Queue()
+        _hubspot_sync_worker_task = asyncio.create_task(_hubspot_sync_worker())
+        logger.info("Started background HubSpot sync worker.")
+
+
+async def stop_hubspot_sync_worker():
+    """Flushes pending updates and stops the worker (call on shutdown)."""
+    global _HUBSPOT_SYNC_QUEUE, _hubspot_sync_worker_task
+    if _hubspot_sync_worker_task is not None:
+        await _HUBSPOT_SYNC_QUEUE.join()
+        _hubspot_sync_worker_task.cancel()
+        try:
+            await _hubspot_sync_worker_task
+        except asyncio.CancelledError:
+            pass
+        _hubspot_sync_worker_task = None
+        _HUBSPOT_SYNC_QUEUE = None
+        logger.info("Stopped background HubSpot sync worker.")
+
+
 # --- MODIFIED validate_and_sync ---
-async def validate_and_sync(contact_data: dict) -> dict:
+async def validate_and_sync(contact_data: dict, validation_result: Optional[dict] = None) -> dict:
     """
     Orchestrates email validation, saves contact & results to DB, and updates HubSpot.
 
     Args:
         contact_data (dict): A dictionary containing contact details, expected keys:
                              'id', 'email', 'firstname', 'lastname'.
+        validation_result (dict, optional): A result from
+                             perform_email_validation_checks computed by the
+                             caller (e.g. concurrently with a contact fetch);
+                             when given, the checks are not re-run here.
 
     Returns:
         dict: The detailed validation result dictionary, potentially with a 'sync_error' key.
@@ -128,112 +339,96 @@ async def validate_and_sync(contact_data: dict) -> dict:
     lastname = contact_data.get('lastname', '')   # Default to empty string
 
     # --- TEMPORARY LOGGING: Check received arguments ---
-    logger.debug(f"validate_and_sync received: contact_id='{contact_id}', email='{email}', firstname='{firstname}', lastname='{lastname}'")
+    logger.debug("validate_and_sync received: contact_id='%s', email='%s', firstname='%s', lastname='%s'", contact_id, email, firstname, lastname)
     # --- END TEMPORARY LOGGING ---
 
     if not contact_id or not email:
-        logger.error(f"💥 Invalid contact data received in validate_and_sync: {contact_data}")
+        logger.error("💥 Invalid contact data received in validate_and_sync: %s", contact_data)
         # Return an error structure or raise an exception
         return {
              "email": email, "status": "error",
              "message": "Missing contact ID or email for sync process."
          }
 
-    sync_error_message = None # Initialize error message
+    sync_errors: list = [] # Accumulated here, joined once at the end
 
     try:
-        logger.info(f"🚀 Starting validation and sync for {email} (Contact ID: {contact_id})")
+        logger.info("🚀 Starting validation and sync for %s (Contact ID: %s)", email, contact_id)
 
-        # 1. Perform all validation checks
-        validation_result = await perform_email_validation_checks(email)
+        # 1. Perform all validation checks (unless the caller already did)
+        if validation_result is None:
+            validation_result = await perform_email_validation_checks(email)
 
         # 2. Save Contact to DB, Save Validation to DB, Update HubSpot
-        loop = asyncio.get_running_loop()
 
         # --- Try Contact DB Upsert ---
         try:
-            logger.debug(f"Attempting Contact DB upsert via executor for contact {contact_id}")
-            # Use functools.partial to pass arguments to the sync function
-            contact_upsert_func = functools.partial(db_upsert_contact, contact_id, firstname, lastname, email)
-            await loop.run_in_executor(None, contact_upsert_func)
-            logger.info(f"Contact DB upsert task completed for contact {contact_id} (check DAO logs for commit status).")
+            logger.debug("Attempting Contact DB upsert via async pool for contact %s", contact_id)
+            await db_aupsert_contact(contact_id, firstname, lastname, email)
+            logger.info("Contact DB upsert task completed for contact %s (check DAO logs for commit status).", contact_id)
         except Exception as contact_db_err:
-            logger.error(f"💥 Error during Contact DB upsert execution for contact {contact_id}: {contact_db_err}", exc_info=True)
-            sync_error_message = f"Contact DB Upsert Failed: {contact_db_err}"
+            logger.error("💥 Error during Contact DB upsert execution for contact %s: %s", contact_id, contact_db_err, exc_info=True)
+            sync_errors.append(f"Contact DB Upsert Failed: {contact_db_err}")
             # Decide if you want to stop here or continue with validation save/HubSpot update
             # For now, we'll record the error and continue
 
         # --- Try Validation Result DB Save ---
         try:
-            logger.debug(f"Attempting Validation Result DB save via executor for contact {contact_id}")
-            db_save_func = functools.partial(db_save_validation_result, validation_result, contact_id)
-            await loop.run_in_executor(None, db_save_func)
-            logger.info(f"Validation Result DB save task completed for contact {contact_id} (check DAO logs for commit status).")
+            logger.debug("Attempting Validation Result DB save via async pool for contact %s", contact_id)
+            await db_asave_validation_result(validation_result, contact_id)
+            logger.info("Validation Result DB save task completed for contact %s (check DAO logs for commit status).", contact_id)
         except Exception as db_err:
-            logger.error(f"💥 Error during Validation Result DB save execution for contact {contact_id}: {db_err}", exc_info=True)
-            # Append error message if one already exists from contact upsert
-            sync_error_message = f"{sync_error_message}; Validation DB Save Failed: {db_err}" if sync_error_message else f"Validation DB Save Failed: {db_err}"
+            logger.error("💥 Error during Validation Result DB save execution for contact %s: %s", contact_id, db_err, exc_info=True)
+            sync_errors.append(f"Validation DB Save Failed: {db_err}")
 
         # --- Try HubSpot Update ---
         try:
-            logger.debug(f"Attempting HubSpot update for contact {contact_id}")
-            hubspot_update_data = {
-                "email_valid_mx": str(validation_result["mx_valid"]).lower(),
-                "email_is_disposable": str(validation_result["is_disposable"]).lower(),
-                "email_is_blacklisted": str(validation_result["is_blacklisted"]).lower(),
-                "email_is_free_provider": str(validation_result["is_free_provider"]).lower(),
-                "email_validation_status": validation_result["status"],
-                "email_validation_message": validation_result["message"]
-            }
-            update_func = functools.partial(update_contact_with_validation_result, contact_id, hubspot_update_data)
-            hubspot_api_response = await loop.run_in_executor(None, update_func)
-
-            if hubspot_api_response is None:
-                logger.warning(f"HubSpot update skipped for contact {contact_id} (likely no valid properties).")
+            logger.debug("Attempting HubSpot update for contact %s", contact_id)
+            hubspot_update_data = _hubspot_update_properties(validation_result)
+
+            if _HUBSPOT_SYNC_QUEUE is not None:
+                # Worker is running: hand the update off and return now, so
+                # response latency doesn't include the HubSpot round-trip.
+                _HUBSPOT_SYNC_QUEUE.put_nowait((contact_id, hubspot_update_data))
+                validation_result["hubspot_sync"] = "queued"
+                logger.info("🔄 HubSpot update for contact %s queued for background sync.", contact_id)
             else:
-                logger.info(f"🔄 HubSpot contact {contact_id} updated successfully.")
+                hubspot_api_response = await aupdate_contact_with_validation_result(
+                    contact_id, hubspot_update_data)
+
+                if hubspot_api_response is None:
+                    logger.warning("HubSpot update skipped for contact %s (likely no valid properties).", contact_id)
+                else:
+                    logger.info("🔄 HubSpot contact %s updated successfully.", contact_id)
 
         # --- Catch Specific HubSpot Errors ---
-        except HubSpotAuthenticationError as e:
-            logger.error(f"🔒 HubSpot Auth Error updating contact {contact_id}: {e}")
-            sync_error_message = f"{sync_error_message}; HubSpot Update Failed (Auth): {e}" if sync_error_message else f"HubSpot Update Failed (Auth): {e}"
-        except HubSpotRateLimitError as e:
-            logger.warning(f"🚦 HubSpot Rate Limit hit updating contact {contact_id}: {e}")
-            sync_error_message = f"{sync_error_message}; HubSpot Update Failed (Rate Limit): {e}" if sync_error_message else f"HubSpot Update Failed (Rate Limit): {e}"
-        except HubSpotNotFoundError as e:
-            logger.warning(f"❓ HubSpot contact {contact_id} not found during update: {e}")
-            sync_error_message = f"{sync_error_message}; HubSpot Update Failed (Not Found): {e}" if sync_error_message else f"HubSpot Update Failed (Not Found): {e}"
-        except HubSpotBadRequestError as e:
-            logger.error(f"📉 HubSpot Bad Request updating contact {contact_id}: {e}")
-            sync_error_message = f"{sync_error_message}; HubSpot Update Failed (Bad Request): {e}" if sync_error_message else f"HubSpot Update Failed (Bad Request): {e}"
-        except HubSpotServerError as e:
-            logger.error(f"💥 HubSpot Server Error updating contact {contact_id}: {e}")
-            sync_error_message = f"{sync_error_message}; HubSpot Update Failed (Server Error): {e}" if sync_error_message else f"HubSpot Update Failed (Server Error): {e}"
         except HubSpotError as e:
-            logger.error(f"💥 HubSpot API Error updating contact {contact_id}: {e}")
-            sync_error_message = f"{sync_error_message}; HubSpot Update Failed (API Error): {e}" if sync_error_message else f"HubSpot Update Failed (API Error): {e}"
+            label, transient = _HS_UPDATE_ERROR_LABELS.get(type(e), ("API Error", False))
+            log = logger.warning if transient else logger.error
+            log("💥 HubSpot %s error updating contact %s: %s", label, contact_id, e)
+            sync_errors.append(f"HubSpot Update Failed ({label}): {e}")
         except Exception as hs_err:
-            logger.error(f"💥 Unexpected error during HubSpot update for contact {contact_id}: {hs_err}", exc_info=True)
-            sync_error_message = f"{sync_error_message}; HubSpot Update Failed (Unexpected): {hs_err}" if sync_error_message else f"HubSpot Update Failed (Unexpected): {hs_err}"
+            logger.error("💥 Unexpected error during HubSpot update for contact %s: %s", contact_id, hs_err, exc_info=True)
+            sync_errors.append(f"HubSpot Update Failed (Unexpected): {hs_err}")
         # --- End of HubSpot update try/except ---
 
         # Add the sync error message to the result if one occurred
-        if sync_error_message:
-            validation_result["sync_error"] = sync_error_message
+        if sync_errors:
+            validation_result["sync_error"] = "; ".join(sync_errors)
 
         # Log completion status
-        completion_status = "✅ Completed" if not sync_error_message else "⚠️ Completed with errors"
-        logger.info(f"{completion_status} validation and sync for {email} (Contact ID: {contact_id})")
+        completion_status = "✅ Completed" if not sync_errors else "⚠️ Completed with errors"
+        logger.info("%s validation and sync for %s (Contact ID: %s)", completion_status, email, contact_id)
         return validation_result
 
     except Exception as e:
         # Catch errors in perform_email_validation_checks or unexpected issues
-        logger.error(f"💥 Unexpected error during validation orchestration for {email}: {str(e)}", exc_info=True)
+        logger.error("💥 Unexpected error during validation orchestration for %s: %s", email, str(e), exc_info=True)
         error_result = {
             "email": email, "domain": "", "mx_valid": False, "is_disposable": False,
             "is_blacklisted": False, "is_free_provider": False,
             "status": "error", "message": f"Orchestration failed: {str(e)}"
         }
-        if sync_error_message: # Include sync errors if they happened before this outer exception
-            error_result["sync_error"] = sync_error_message
+        if sync_errors: # Include sync errors if they happened before this outer exception
+            error_result["sync_error"] = "; ".join(sync_errors)
         return error_result
\ No newline at end of file
@@ -1,14 +1,38 @@
 # sync_contacts.py
+from itertools import islice
+
+from db.connector import get_db_connection
 from db.email_dao import insert_contacts
-from hubspot_client.contacts_client import fetch_all_contacts
+from hubspot_client.contacts_client import iter_hubspot_contacts
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Contacts staged per insert_contacts call; each call is one fast_executemany
+# load plus a single MERGE, so this bounds memory without paying a DB
+# round-trip per row.
+SYNC_INSERT_BATCH_SIZE = 500
+
 def sync():
-    contacts = fetch_all_contacts()
-    logger.debug(f"Fetched contacts: {contacts}")
-    insert_contacts(contacts)
+    """
+    Streams all contacts from HubSpot and batch-upserts them into the database.
+
+    Contacts are pulled page by page and flushed every SYNC_INSERT_BATCH_SIZE
+    rows, so memory stays flat and each flush is a single batched round-trip
+    instead of an insert per contact.
+    """
+    # Name the properties explicitly: the fetch default is MINIMAL_PROPERTIES
+    # (email only), and the staging MERGE overwrites firstname/lastname on
+    # matched rows — fetching without names would blank them on every run.
+    contacts = iter_hubspot_contacts(properties=["email", "firstname", "lastname"])
+    total = 0
+    # One connection for the whole run; each chunk reuses it instead of
+    # paying a pool checkout (or worse, a fresh login) per flush.
+    with get_db_connection() as conn:
+        while batch := list(islice(contacts, SYNC_INSERT_BATCH_SIZE)):
+            insert_contacts(batch, conn=conn)
+            total += len(batch)
+    logger.info("Synced %d contacts from HubSpot into the database.", total)
 
 if __name__ == "__main__":
     sync()
@@ -1,6 +1,7 @@
 # c:\Users\garre\OneDrive\Desktop\custom-email-api\tests\conftest.py
 
 import sys
+import types
 from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
@@ -24,11 +25,15 @@ except ImportError as e:
                       f"Original error: {e}")
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def client() -> TestClient:
     """
     Provides a FastAPI TestClient instance for making requests to the app.
-    Scope is 'function' by default, meaning a new client is created for each test function.
+
+    Session-scoped: the app is immutable across tests and TestClient
+    construction spins up the lifespan and a portal thread, so one shared
+    client avoids paying that per test. Per-test patching still works —
+    mocker patches attributes on the imported 'main' module, not the client.
     """
     # Create a TestClient instance using your FastAPI app
     test_client = TestClient(app)
@@ -37,22 +42,29 @@ def client() -> TestClient:
 # --- Optional: Add other shared fixtures below ---
 
 # Example: Fixture for database setup/teardown (more complex)
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def db_session():
     """
     Placeholder fixture for a database session.
     Requires implementation of TestSessionLocal and DB handling.
+
+    Session-scoped and print-free until real setup/teardown exists: the old
+    per-test print() calls went through pytest's capture plugin on every
+    invocation for a constant return value. Drop back to function scope when
+    real transactional teardown is added.
     """
-    print("\n--- DB Session Setup (Placeholder) ---")
-    session = "mock_db_session"
-    try:
-        yield session
-    finally:
-        print("\n--- DB Session Teardown (Placeholder) ---")
+    return "mock_db_session"
 
 
 # Example: Fixture for mock data
-@pytest.fixture
+# Built once at import and wrapped read-only; the proxy makes an accidental
+# mutation in one test fail loudly instead of leaking into the others.
+_SAMPLE_CONTACT_PAYLOAD = types.MappingProxyType(
+    {"name": "Test User", "email": "test@example.com", "phone": "1234567890"}
+)
+
+
+@pytest.fixture(scope="session")
 def sample_contact_payload():
-    """Provides a sample dictionary representing a contact payload."""
-    return {"name": "Test User", "email": "test@example.com", "phone": "1234567890"}
+    """Provides a sample mapping representing a contact payload (read-only)."""
+    return _SAMPLE_CONTACT_PAYLOAD
@@ -3,38 +3,41 @@
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock # For mocking async functions
+# Note: no explicit mock classes needed — mocker.patch picks AsyncMock for
+# coroutine targets and the default MagicMock otherwise.
 
 # Import specific HubSpot exceptions your endpoint might catch
 from hubspot_client.exceptions import (
     HubSpotAuthenticationError, HubSpotRateLimitError
 )
 
-# Mark all tests in this module as async using pytest-asyncio
-pytestmark = pytest.mark.asyncio
+
+@pytest.fixture(scope="module")
+def valid_validation_result():
+    """Shared 'valid' validation payload (module-scoped; treat as read-only)."""
+    return {
+        "email": "test@example.com", "status": "valid", "message": "Looks good",
+        "mx_valid": False, "is_disposable": False, "is_blacklisted": False,
+        "is_free_provider": False
+    }
 
 # --- Tests for /upsert-contact ---
 
-async def test_upsert_contact_success(client: TestClient, mocker):
+def test_upsert_contact_success(client: TestClient, mocker, valid_validation_result):
     """
     Test successful contact upsert when email is valid and HubSpot call succeeds.
     """
     # Arrange: Mock dependencies
-    mock_validation_result = {
-        "email": "test@example.com", "status": "valid", "message": "Looks good",
-        "mx_valid": False, "is_disposable": False, "is_blacklisted": False,
-        "is_free_provider": False
-    }
+    mock_validation_result = valid_validation_result
     mock_hubspot_response = {"id": "12345", "properties": {"email": "test@example.com"}, "isNew": True}
     mock_db_save_result = None # Assume DB save returns None on success
 
     # Mock the validation check within main.py
     mocker.patch("main.perform_email_validation_checks", return_value=mock_validation_result)
     # Mock the HubSpot client function within main.py
-    # Use AsyncMock if the original function called via run_in_executor is async,
-    # otherwise, a regular MagicMock might suffice if the target is sync.
-    # Let's assume create_or_update_hubspot_contact itself is synchronous but called via executor
-    mock_hs_upsert = mocker.patch("main.create_or_update_hubspot_contact", return_value=mock_hubspot_response)
+    # acreate_or_update_hubspot_contact is a coroutine function, so mocker.patch
+    # automatically substitutes an AsyncMock here.
+    mock_hs_upsert = mocker.patch("main.acreate_or_update_hubspot_contact", return_value=mock_hubspot_response)
     # Mock the DB save function within main.py
     mock_db_save = mocker.patch("main.db_save_validation_result", return_value=mock_db_save_result)
 
@@ -74,14 +77,14 @@ async def test_upsert_contact_success(client: TestClient, mocker):
     assert db_call_args_tuple[0] == mock_validation_result # Passed the validation result
     assert db_call_args_tuple[1] == "12345" # Passed the HubSpot contact ID
 
-async def test_upsert_contact_validation_fails(client: TestClient, mocker):
+def test_upsert_contact_validation_fails(client: TestClient, mocker):
     """
     Test contact upsert fails (400) when email validation returns an error.
     """
     # Arrange: Mock validation to fail
     mock_validation_result = {"email": "invalid-email", "status": "error", "message": "Invalid format"}
     mocker.patch("main.perform_email_validation_checks", return_value=mock_validation_result)
-    mock_hs_upsert = mocker.patch("main.create_or_update_hubspot_contact") # Mock to ensure it's NOT called
+    mock_hs_upsert = mocker.patch("main.acreate_or_update_hubspot_contact") # Mock to ensure it's NOT called
     mock_db_save = mocker.patch("main.db_save_validation_result") # Mock to ensure it's NOT called
 
     # Act
@@ -97,18 +100,20 @@ async def test_upsert_contact_validation_fails(client: TestClient, mocker):
     mock_db_save.assert_not_called()
 
 
-async def test_upsert_contact_hubspot_auth_error(client: TestClient, mocker):
-    """
-    Test contact upsert fails (503) when HubSpot client raises AuthenticationError.
-    """
-    # Arrange: Mock validation success, HubSpot auth error
-    mock_validation_result = {
-        "email": "test@example.com", "status": "valid", "message": "Looks good",
-        "mx_valid": False, "is_disposable": False, "is_blacklisted": False,
-        "is_free_provider": False
-    }
-    mocker.patch("main.perform_email_validation_checks", return_value=mock_validation_result)
-    mocker.patch("main.create_or_update_hubspot_contact", side_effect=HubSpotAuthenticationError("Invalid API key"))
+# One parametrized test per HubSpot failure mode; the bodies were identical
+# apart from the raised exception and the expected status/detail.
+@pytest.mark.parametrize("hubspot_error,expected_status,expected_detail", [
+    (HubSpotAuthenticationError("Invalid API key"),
+     status.HTTP_503_SERVICE_UNAVAILABLE, "HubSpot Authentication Failed"),
+    (HubSpotRateLimitError("Rate limit exceeded"),
+     status.HTTP_429_TOO_MANY_REQUESTS, "HubSpot Rate Limit Exceeded"),
+])
+def test_upsert_contact_hubspot_error(client: TestClient, mocker, valid_validation_result,
+                                            hubspot_error, expected_status, expected_detail):
+    """Test contact upsert maps HubSpot client errors to the right status."""
+    # Arrange: Mock validation success, HubSpot error
+    mocker.patch("main.perform_email_validation_checks", return_value=valid_validation_result)
+    mocker.patch("main.acreate_or_update_hubspot_contact", side_effect=hubspot_error)
     mock_db_save = mocker.patch("main.db_save_validation_result") # Mock to ensure it's NOT called
 
     # Act
@@ -118,33 +123,12 @@ async def test_upsert_contact_hubspot_auth_error(client: TestClient, mocker):
     )
 
     # Assert
-    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
-    assert "HubSpot Authentication Failed" in response.json()["detail"]
-    mock_db_save.assert_not_called()
-
-# --- Add more tests for other HubSpot errors (RateLimit, BadRequest, etc.) ---
-# Example:
-async def test_upsert_contact_hubspot_rate_limit(client: TestClient, mocker):
-    """Test contact upsert fails (429) on HubSpot RateLimitError."""
-    # Arrange
-    mock_validation_result = {"email": "test@example.com", "status": "valid", "message": "Looks good", "mx_valid": True, "is_disposable": False, "is_blacklisted": False, "is_free_provider": False}
-    mocker.patch("main.perform_email_validation_checks", return_value=mock_validation_result)
-    mocker.patch("main.create_or_update_hubspot_contact", side_effect=HubSpotRateLimitError("Rate limit exceeded"))
-    mock_db_save = mocker.patch("main.db_save_validation_result")
-
-    # Act
-    response = client.post(
-        "/upsert-contact",
-        params={"email": "test@example.com", "firstname": "Test", "lastname": "User"}
-    )
-
-    # Assert
-    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-    assert "HubSpot Rate Limit Exceeded" in response.json()["detail"]
+    assert response.status_code == expected_status
+    assert expected_detail in response.json()["detail"]
     mock_db_save.assert_not_called()
 
 
-async def test_upsert_contact_db_save_fails_warning(client: TestClient, mocker):
+def test_upsert_contact_db_save_fails_warning(client: TestClient, mocker):
     """
     Test upsert succeeds (200) but returns warning if DB save fails post-HubSpot success.
     """
@@ -154,7 +138,7 @@ async def test_upsert_contact_db_save_fails_warning(client: TestClient, mocker):
     db_error_message = "Connection timed out"
 
     mocker.patch("main.perform_email_validation_checks", return_value=mock_validation_result)
-    mock_hs_upsert = mocker.patch("main.create_or_update_hubspot_contact", return_value=mock_hubspot_response)
+    mock_hs_upsert = mocker.patch("main.acreate_or_update_hubspot_contact", return_value=mock_hubspot_response)
     # Mock DB save to raise an exception
     mock_db_save = mocker.patch("main.db_save_validation_result", side_effect=Exception(db_error_message))
 
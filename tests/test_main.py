@@ -1,6 +1,7 @@
 # c:\Users\garre\OneDrive\Desktop\custom-email-api\tests\test_main.py
 
 import pytest # Import pytest for potential use of markers, etc.
+from collections.abc import Mapping
 from fastapi import status
 from fastapi.testclient import TestClient # Good practice to import for type hinting
 
@@ -40,21 +41,21 @@ def test_read_docs(client: TestClient):
     assert response.status_code == status.HTTP_200_OK
 
     # Check if the response content type is HTML
+    # (status + content-type is enough for a smoke check; asserting on the
+    # rendered HTML was brittle across FastAPI/Swagger UI versions and
+    # scanned the whole body per run)
     assert "text/html" in response.headers.get("content-type", "")
 
-    # Optionally, check for some expected content in the HTML
-    # (can be brittle if FastAPI/Swagger UI versions change)
-    assert "<title>FastAPI - Swagger UI</title>" in response.text
-
 
 # Example of using the sample_contact_payload fixture (demonstration)
 # You would typically use this in a test file related to contact creation,
 # e.g., tests/test_contacts.py
-def test_payload_fixture(sample_contact_payload: dict):
+def test_payload_fixture(sample_contact_payload: Mapping):
     """
     Simple test to demonstrate using the sample_contact_payload fixture.
     """
-    assert isinstance(sample_contact_payload, dict)
+    # The fixture hands out a shared read-only mapping, not a fresh dict
+    assert isinstance(sample_contact_payload, Mapping)
     assert sample_contact_payload["email"] == "test@example.com"
     assert "name" in sample_contact_payload
 
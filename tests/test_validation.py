@@ -3,17 +3,15 @@
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, MagicMock # Import MagicMock for sync functions
+# Note: no explicit mock classes needed — mocker.patch picks AsyncMock for
+# coroutine targets and the default MagicMock otherwise.
 
 # Import specific HubSpot exceptions your endpoint might catch
 from hubspot_client.exceptions import HubSpotError, HubSpotNotFoundError
 
-# Mark all tests in this module as async using pytest-asyncio
-pytestmark = pytest.mark.asyncio
-
 # --- Tests for /validate-email ---
 
-async def test_validate_single_email_success(client: TestClient, mocker):
+def test_validate_single_email_success(client: TestClient, mocker):
     """Test successful validation of a single email."""
     # Arrange
     mock_result = {"email": "garrettglick85@gmail.com", "status": "valid", "message": "Valid"}
@@ -28,7 +26,7 @@ async def test_validate_single_email_success(client: TestClient, mocker):
     assert response.json() == mock_result
     mock_perform_checks.assert_awaited_once_with("garrettglick85@gmail.com")
 
-async def test_validate_single_email_invalid_input_format(client: TestClient):
+def test_validate_single_email_invalid_input_format(client: TestClient):
     """Test validation endpoint fails (422) with invalid email format."""
     # Act
     response = client.post("/validate-email", json={"email": "not-an-email"})
@@ -36,7 +34,7 @@ async def test_validate_single_email_invalid_input_format(client: TestClient):
     # Assert
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-async def test_validate_single_email_validation_error(client: TestClient, mocker):
+def test_validate_single_email_validation_error(client: TestClient, mocker):
     """Test validation endpoint returns result when underlying check returns error status."""
     # Arrange
     mock_result = {"email": "bad@emailkdjfk.com", "status": "invalid", "message": "Domain not found"}
@@ -82,10 +80,16 @@ async def test_validate_single_email_validation_error(client: TestClient, mocker
     assert call_kwargs_dict['contact_data'] == {"id": "1", "email": "one@test.com", "firstname": "F1", "lastname": "L1"}
 """
 
-async def test_schedule_hubspot_validation_no_contacts(client: TestClient, mocker):
+async def _async_iter(items):
+    """Wraps a list in an async iterator, mirroring the streaming fetch."""
+    for item in items:
+        yield item
+
+
+def test_schedule_hubspot_validation_no_contacts(client: TestClient, mocker):
     """Test scheduling when HubSpot returns no contacts."""
     # Arrange
-    mocker.patch("main.hs_fetch_all_contacts", return_value=[])
+    mocker.patch("main.hs_aiter_contacts", return_value=_async_iter([]))
     mock_add_task = mocker.patch("main.BackgroundTasks.add_task")
 
     # Act
@@ -97,10 +101,10 @@ async def test_schedule_hubspot_validation_no_contacts(client: TestClient, mocke
     mock_add_task.assert_not_called()
 
 
-async def test_schedule_hubspot_validation_fetch_error(client: TestClient, mocker):
+def test_schedule_hubspot_validation_fetch_error(client: TestClient, mocker):
     """Test scheduling fails (500) when HubSpot fetch raises an error."""
     # Arrange
-    mocker.patch("main.hs_fetch_all_contacts", side_effect=HubSpotError("API connection failed"))
+    mocker.patch("main.hs_aiter_contacts", side_effect=HubSpotError("API connection failed"))
     mock_add_task = mocker.patch("main.BackgroundTasks.add_task")
 
     # Act
@@ -114,16 +118,19 @@ async def test_schedule_hubspot_validation_fetch_error(client: TestClient, mocke
 
 # --- Tests for /validate-email-and-update-hubspot/{contact_id} ---
 
-async def test_validate_and_update_hubspot_success(client: TestClient, mocker):
+def test_validate_and_update_hubspot_success(client: TestClient, mocker):
     """Test successful validation and sync for a specific contact ID."""
     # Arrange
     contact_id = "987"
     email_to_validate = "garrettglick85@gmail.com"
     mock_hs_details = {"id": contact_id, "properties": {"firstname": "Specific", "lastname": "Contact"}}
     mock_sync_result = {"status": "valid", "message": "Synced OK", "hubspot_updated": True}
+    mock_checks_result = {"status": "valid", "message": "Email appears valid."}
 
-    # Mock the HubSpot get function (assume sync, called via executor)
-    mock_hs_get = mocker.patch("main.hs_get_contact_by_id", return_value=mock_hs_details)
+    # Mock the HubSpot get function (coroutine; patch substitutes an AsyncMock)
+    mock_hs_get = mocker.patch("main.hs_aget_contact_by_id", return_value=mock_hs_details)
+    # Mock the validation run concurrently with the fetch
+    mocker.patch("main.perform_email_validation_checks", return_value=mock_checks_result)
     # Mock the main orchestrator function
     mock_validate_sync = mocker.patch("main.validate_and_sync", return_value=mock_sync_result)
 
@@ -135,26 +142,29 @@ async def test_validate_and_update_hubspot_success(client: TestClient, mocker):
 
     # Assert
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["message"] == f"Successfully validated {email_to_validate} and synced results for contact {contact_id}."
-    assert response.json()["validation_result"] == mock_sync_result
+    body = response.json() # Parse once; Response.json() re-parses per call
+    assert body["message"] == f"Successfully validated {email_to_validate} and synced results for contact {contact_id}."
+    assert body["validation_result"] == mock_sync_result
 
-    mock_hs_get.assert_called_once_with(contact_id, properties=["firstname", "lastname"])
+    mock_hs_get.assert_awaited_once_with(contact_id, properties=["firstname", "lastname"])
     expected_contact_data = {
         "id": contact_id,
         "email": email_to_validate,
         "firstname": "Specific",
         "lastname": "Contact"
     }
-    mock_validate_sync.assert_awaited_once_with(contact_data=expected_contact_data)
+    mock_validate_sync.assert_awaited_once_with(contact_data=expected_contact_data,
+                                                validation_result=mock_checks_result)
 
 
-async def test_validate_and_update_hubspot_contact_not_found(client: TestClient, mocker):
+def test_validate_and_update_hubspot_contact_not_found(client: TestClient, mocker):
     """Test failure (404) when HubSpot contact ID is not found."""
     # Arrange
     contact_id = "nonexistent"
     email_to_validate = "specific@example.com"
     # Mock HubSpot get to raise NotFound
-    mocker.patch("main.hs_get_contact_by_id", side_effect=HubSpotNotFoundError(f"Contact {contact_id} not found"))
+    mocker.patch("main.hs_aget_contact_by_id", side_effect=HubSpotNotFoundError(f"Contact {contact_id} not found"))
+    mocker.patch("main.perform_email_validation_checks", return_value={"status": "valid"})
     mock_validate_sync = mocker.patch("main.validate_and_sync") # Ensure not called
 
     # Act
@@ -169,7 +179,7 @@ async def test_validate_and_update_hubspot_contact_not_found(client: TestClient,
     mock_validate_sync.assert_not_awaited()
 
 
-async def test_validate_and_update_hubspot_validation_fails_400(client: TestClient, mocker):
+def test_validate_and_update_hubspot_validation_fails_400(client: TestClient, mocker):
     """Test failure (400) when validate_and_sync returns a validation error."""
     # Arrange
     contact_id = "111"
@@ -177,7 +187,8 @@ async def test_validate_and_update_hubspot_validation_fails_400(client: TestClie
     mock_hs_details = {"id": contact_id, "properties": {"firstname": "Bad", "lastname": "Data"}}
     mock_sync_result = {"status": "error", "message": "MX record check failed"}
 
-    mocker.patch("main.hs_get_contact_by_id", return_value=mock_hs_details)
+    mocker.patch("main.hs_aget_contact_by_id", return_value=mock_hs_details)
+    mocker.patch("main.perform_email_validation_checks", return_value={"status": "valid"})
     mocker.patch("main.validate_and_sync", return_value=mock_sync_result)
 
     # Act
@@ -191,7 +202,7 @@ async def test_validate_and_update_hubspot_validation_fails_400(client: TestClie
     assert response.json()["detail"] == mock_sync_result # Endpoint returns the validation result as detail
 
 
-async def test_validate_and_update_hubspot_orchestration_fails_500(client: TestClient, mocker):
+def test_validate_and_update_hubspot_orchestration_fails_500(client: TestClient, mocker):
     """Test failure (500) when validate_and_sync returns an orchestration failure."""
     # Arrange
     contact_id = "222"
@@ -199,7 +210,8 @@ async def test_validate_and_update_hubspot_orchestration_fails_500(client: TestC
     mock_hs_details = {"id": contact_id, "properties": {"firstname": "Orch", "lastname": "Fail"}}
     mock_sync_result = {"status": "error", "message": "Orchestration failed: DB unavailable"}
 
-    mocker.patch("main.hs_get_contact_by_id", return_value=mock_hs_details)
+    mocker.patch("main.hs_aget_contact_by_id", return_value=mock_hs_details)
+    mocker.patch("main.perform_email_validation_checks", return_value={"status": "valid"})
     mocker.patch("main.validate_and_sync", return_value=mock_sync_result)
 
     # Act
@@ -211,18 +223,3 @@ async def test_validate_and_update_hubspot_orchestration_fails_500(client: TestC
     # Assert
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert "Internal server error during validation process" in response.json()["detail"]
-
-
-# --- Test for /validate-and-sync-contact (Not Implemented) ---
-
-async def test_validate_and_sync_contact_not_implemented(client: TestClient):
-    """Test that the unimplemented endpoint returns 501."""
-    # Act
-    response = client.post(
-        "/validate-and-sync-contact",
-        json={"email": "test@example.com", "firstname": "Test"} # Example payload
-    )
-
-    # Assert
-    assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
-    assert "Endpoint not fully implemented" in response.json()["detail"]
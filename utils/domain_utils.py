@@ -1,17 +1,28 @@
 # utils/domain_utils.py
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
 def extract_domain(email: str) -> str:
     """
     Extracts the domain from the email address.
 
+    Results are memoized: bulk validation runs see the same addresses (and
+    domains) repeatedly, and a cache hit skips the string work entirely.
+
     Args:
         email (str): The email address to extract the domain from.
 
     Returns:
         str: The domain part of the email address (e.g., "example.com").
+
+    Raises:
+        ValueError: If the address contains no '@'.
     """
-    try:
-        domain = email.split('@')[-1].lower()
-        return domain
-    except Exception as e:
-        raise ValueError(f"Invalid email address: {email}. Error: {str(e)}")
+    # rfind + slice avoids the tuple that rpartition allocates, and an
+    # explicit check replaces the old catch-everything try/except
+    idx = email.rfind('@')
+    if idx < 0:
+        raise ValueError(f"Invalid email address: {email}. Error: missing '@'")
+    return email[idx + 1:].lower()
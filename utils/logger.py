@@ -1,11 +1,53 @@
 # utils/logger.py
 
 import logging
+import os
+import time
+from functools import lru_cache
 
+# Environment-driven level so production can silence per-request log volume
+# (every formatted record is a GIL-holding stdout write) without a code
+# change: e.g. LOG_LEVEL=WARNING in prod, LOG_LEVEL=DEBUG when digging in.
+# Unknown names fall back to INFO, the historical default.
+_LOG_LEVEL = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
+
+class _CachedAsctimeFormatter(logging.Formatter):
+    """
+    Formatter that caches the strftime part of asctime per second.
+
+    logging runs localtime + strftime for every record; chatty pipelines emit
+    many records within the same second, so the wall-clock string is reused
+    until the second ticks over. Milliseconds are still appended per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+        if self.default_msec_format:
+            return self.default_msec_format % (self._cached_time, record.msecs)
+        return self._cached_time
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Returns a logger instance with the given name.
 
+    Memoized per name: repeated calls return the same configured logger
+    without re-running the handler setup. The handler guard below protects
+    the non-cached path too (e.g. module reloads) — stacking a StreamHandler
+    per call would emit every record once per handler.
+
     Args:
         name (str): The name for the logger.
 
@@ -13,9 +55,10 @@ def get_logger(name: str) -> logging.Logger:
         logging.Logger: The logger instance.
     """
     logger = logging.getLogger(name)
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = _CachedAsctimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.setLevel(_LOG_LEVEL)
     return logger
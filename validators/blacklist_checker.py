@@ -1,21 +1,51 @@
-import asyncio
+import os
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-BLACKLISTED_DOMAINS = {"spamdomain.com", "malicious.org"}
+# Built-in fallback list; a fuller list can be supplied via BLACKLISTED_DOMAINS_FILE.
+_DEFAULT_BLACKLISTED_DOMAINS = frozenset({"spamdomain.com", "malicious.org"})
 
-async def is_blacklisted(email: str) -> bool:
-    domain = email.split('@')[-1].lower()
 
-    logger.info(f"Checking if domain {domain} is blacklisted...")
+def load_blacklisted_domains() -> frozenset:
+    """
+    Loads the blacklist domain set, once, into a frozenset for O(1) membership.
+
+    Reads a newline-delimited domain list from the file named by the
+    BLACKLISTED_DOMAINS_FILE environment variable if set; otherwise falls back
+    to the built-in default set.
+    """
+    path = os.getenv("BLACKLISTED_DOMAINS_FILE")
+    if path:
+        try:
+            with open(path, encoding="utf-8") as f:
+                domains = frozenset(line.strip().lower() for line in f if line.strip())
+            if domains:
+                logger.info("Loaded %d blacklisted domains from %s.", len(domains), path)
+                return domains
+        except OSError as e:
+            logger.warning("Could not read blacklisted domains from %s: %s. Using built-in list.", path, e)
+    return _DEFAULT_BLACKLISTED_DOMAINS
+
+
+BLACKLISTED_DOMAINS = load_blacklisted_domains()
+
+
+def refresh_blacklisted_domains():
+    """Re-reads the domain source and atomically rebinds the module-level set."""
+    global BLACKLISTED_DOMAINS
+    BLACKLISTED_DOMAINS = load_blacklisted_domains()
+
+
+def is_blacklisted(email: str) -> bool:
+    domain = email.rpartition('@')[2].lower()
+
+    logger.debug("Checking if domain %s is blacklisted...", domain)
 
-    # Simulate a potentially I/O-bound task
-    await asyncio.sleep(0)  # Simulating async behavior
 
     if domain in BLACKLISTED_DOMAINS:
-        logger.warning(f"Domain {domain} is blacklisted.")
+        logger.warning("Domain %s is blacklisted.", domain)
         return True
 
-    logger.info(f"Domain {domain} is not blacklisted.")
+    logger.debug("Domain %s is not blacklisted.", domain)
     return False
@@ -1,21 +1,51 @@
-import asyncio
+import os
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-DISPOSABLE_DOMAINS = {"mailinator.com", "10minutemail.com", "guerrillamail.com"}
+# Built-in fallback list; a fuller list can be supplied via DISPOSABLE_DOMAINS_FILE.
+_DEFAULT_DISPOSABLE_DOMAINS = frozenset({"mailinator.com", "10minutemail.com", "guerrillamail.com"})
 
-async def is_disposable(email: str) -> bool:
-    domain = email.split('@')[-1].lower()
 
-    logger.info(f"Checking if domain {domain} is a disposable email provider...")
+def load_disposable_domains() -> frozenset:
+    """
+    Loads the disposable-domain set, once, into a frozenset for O(1) membership.
+
+    Reads a newline-delimited domain list from the file named by the
+    DISPOSABLE_DOMAINS_FILE environment variable if set; otherwise falls back
+    to the built-in default set.
+    """
+    path = os.getenv("DISPOSABLE_DOMAINS_FILE")
+    if path:
+        try:
+            with open(path, encoding="utf-8") as f:
+                domains = frozenset(line.strip().lower() for line in f if line.strip())
+            if domains:
+                logger.info("Loaded %d disposable domains from %s.", len(domains), path)
+                return domains
+        except OSError as e:
+            logger.warning("Could not read disposable domains from %s: %s. Using built-in list.", path, e)
+    return _DEFAULT_DISPOSABLE_DOMAINS
+
+
+DISPOSABLE_DOMAINS = load_disposable_domains()
+
+
+def refresh_disposable_domains():
+    """Re-reads the domain source and atomically rebinds the module-level set."""
+    global DISPOSABLE_DOMAINS
+    DISPOSABLE_DOMAINS = load_disposable_domains()
+
+
+def is_disposable(email: str) -> bool:
+    domain = email.rpartition('@')[2].lower()
+
+    logger.debug("Checking if domain %s is a disposable email provider...", domain)
 
-    # Simulate a potentially I/O-bound task
-    await asyncio.sleep(0)  # Simulating async behavior
 
     if domain in DISPOSABLE_DOMAINS:
-        logger.warning(f"Domain {domain} is a disposable email provider.")
+        logger.warning("Domain %s is a disposable email provider.", domain)
         return True
 
-    logger.info(f"Domain {domain} is not a disposable email provider.")
+    logger.debug("Domain %s is not a disposable email provider.", domain)
     return False
@@ -0,0 +1,45 @@
+# validators/domain_flags.py
+
+from validators import disposable_checker, blacklist_checker, free_provider_checker
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["DISPOSABLE", "BLACKLISTED", "FREE_PROVIDER", "classify_domain", "rebuild_domain_flags"]
+
+# Bitmask flags for the combined domain classifier
+DISPOSABLE = 1
+BLACKLISTED = 2
+FREE_PROVIDER = 4
+
+
+def _build_domain_flags() -> dict:
+    """Merges the three checker domain sets into one domain -> bitmask map."""
+    flags: dict = {}
+    for domain in disposable_checker.DISPOSABLE_DOMAINS:
+        flags[domain] = flags.get(domain, 0) | DISPOSABLE
+    for domain in blacklist_checker.BLACKLISTED_DOMAINS:
+        flags[domain] = flags.get(domain, 0) | BLACKLISTED
+    for domain in free_provider_checker.FREE_EMAIL_PROVIDERS:
+        flags[domain] = flags.get(domain, 0) | FREE_PROVIDER
+    return flags
+
+
+_DOMAIN_FLAGS = _build_domain_flags()
+
+
+def classify_domain(domain: str) -> int:
+    """
+    Classifies a (lowercased) domain with a single hash lookup.
+
+    Returns a bitmask of DISPOSABLE / BLACKLISTED / FREE_PROVIDER flags,
+    or 0 if the domain is in none of the lists.
+    """
+    return _DOMAIN_FLAGS.get(domain, 0)
+
+
+def rebuild_domain_flags():
+    """Rebuilds the combined map (call after the checker sets are refreshed)."""
+    global _DOMAIN_FLAGS
+    _DOMAIN_FLAGS = _build_domain_flags()
+    logger.info("Rebuilt combined domain-flag map (%d domains).", len(_DOMAIN_FLAGS))
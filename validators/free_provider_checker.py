@@ -1,21 +1,51 @@
-import asyncio
+import os
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-FREE_EMAIL_PROVIDERS = {"gmail.com", "yahoo.com", "outlook.com", "hotmail.com"}
+# Built-in fallback list; a fuller list can be supplied via FREE_PROVIDER_DOMAINS_FILE.
+_DEFAULT_FREE_EMAIL_PROVIDERS = frozenset({"gmail.com", "yahoo.com", "outlook.com", "hotmail.com"})
 
-async def is_free_provider(email: str) -> bool:
-    domain = email.split('@')[-1].lower()
 
-    logger.info(f"Checking if domain {domain} is a free email provider...")
+def load_free_provider_domains() -> frozenset:
+    """
+    Loads the free-provider domain set, once, into a frozenset for O(1) membership.
+
+    Reads a newline-delimited domain list from the file named by the
+    FREE_PROVIDER_DOMAINS_FILE environment variable if set; otherwise falls
+    back to the built-in default set.
+    """
+    path = os.getenv("FREE_PROVIDER_DOMAINS_FILE")
+    if path:
+        try:
+            with open(path, encoding="utf-8") as f:
+                domains = frozenset(line.strip().lower() for line in f if line.strip())
+            if domains:
+                logger.info("Loaded %d free-provider domains from %s.", len(domains), path)
+                return domains
+        except OSError as e:
+            logger.warning("Could not read free-provider domains from %s: %s. Using built-in list.", path, e)
+    return _DEFAULT_FREE_EMAIL_PROVIDERS
+
+
+FREE_EMAIL_PROVIDERS = load_free_provider_domains()
+
+
+def refresh_free_provider_domains():
+    """Re-reads the domain source and atomically rebinds the module-level set."""
+    global FREE_EMAIL_PROVIDERS
+    FREE_EMAIL_PROVIDERS = load_free_provider_domains()
+
+
+def is_free_provider(email: str) -> bool:
+    domain = email.rpartition('@')[2].lower()
+
+    logger.debug("Checking if domain %s is a free email provider...", domain)
 
-    # Simulate a potentially I/O-bound task
-    await asyncio.sleep(0)  # Simulating async behavior
 
     if domain in FREE_EMAIL_PROVIDERS:
-        logger.warning(f"Domain {domain} is a free email provider.")
+        logger.warning("Domain %s is a free email provider.", domain)
         return True
 
-    logger.info(f"Domain {domain} is not a free email provider.")
+    logger.debug("Domain %s is not a free email provider.", domain)
     return False
@@ -1,7 +1,11 @@
 import asyncio
+import re
 import sys
 import aiodns
 import tldextract
+from collections import defaultdict
+from functools import lru_cache
+from cachetools import TTLCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,64 +15,132 @@ if sys.platform.startswith("win"):
 
 __all__ = ["check_mx_records"]
 
-INVALID_TLDS = {
+# In-process cache for MX lookups: repeated validations of the same domain are
+# common, and a cache hit skips the DNS round trip entirely. Negative results
+# are cached too (a domain without MX records won't grow them within the TTL).
+_MX_CACHE: TTLCache = TTLCache(maxsize=100_000, ttl=3600)
+
+# Per-domain locks so concurrent misses for the same domain coalesce into a
+# single DNS query instead of a thundering herd.
+_MX_LOCKS: defaultdict = defaultdict(asyncio.Lock)
+
+# One resolver for the whole process, created lazily inside the running loop
+# (aiodns binds to the loop at construction). Building one per call re-read
+# resolver configuration and threw away the underlying c-ares channel's
+# connection state on every lookup.
+_RESOLVER = None
+
+
+def _get_resolver() -> aiodns.DNSResolver:
+    global _RESOLVER
+    if _RESOLVER is None:
+        _RESOLVER = aiodns.DNSResolver(nameservers=["8.8.8.8", "8.8.4.4"], timeout=5)
+    return _RESOLVER
+
+INVALID_TLDS = frozenset({
     "example", "invalid", "test", "localhost", "local", "onion", "onion.link"
-}
+})
 
-TEST_DOMAINS = {
+TEST_DOMAINS = frozenset({
     "example.com", "test.com", "localhost.com", "invalid.com"
-}
+})
 
-async def check_mx_records(domain: str):
-    extracted = tldextract.extract(domain)
-    tld = extracted.suffix
+# Offline extractor pinned to the bundled suffix snapshot, so the first parse
+# can't block on a public-suffix-list download; the module default extractor
+# may fetch it over the network.
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), fallback_to_snapshot=True)
 
-    if tld in INVALID_TLDS:
-        logger.warning(f"⚠️ Invalid TLD: {tld}")
-        return None
 
-    if domain.lower() in TEST_DOMAINS:
-        logger.warning(f"⚠️ Test domain: {domain}")
-        return None
+@lru_cache(maxsize=4096)
+def _get_suffix(domain: str) -> str:
+    """Returns the public suffix of a domain; PSL parses are memoized."""
+    return _TLD_EXTRACT(domain).suffix
 
-    try:
-        domain = domain.replace("http://", "").replace("https://", "").replace("www.", "")
-        logger.info(f"🔎 Checking MX records for: {domain}")
 
-        resolver = aiodns.DNSResolver(nameservers=["8.8.8.8", "8.8.4.4"], timeout=5)
+# Strips an accidental scheme and/or www. prefix in one pass instead of the
+# old three sequential str.replace rewrites.
+_SCHEME_RE = re.compile(r"^(?:https?://)?(?:www\.)?")
 
-        response = await asyncio.wait_for(resolver.query(domain, "MX"), timeout=5)
-
-        if not response:
-            logger.warning(f"⚠️ No MX records for {domain}")
-            return None
 
-        mx_records = [str(rdata.host) for rdata in response]
-        logger.info(f"✅ Found MX records for {domain}: {mx_records}")
-        return mx_records
+async def check_mx_records(domain: str):
+    # Reject in cheap→expensive order: O(1) set lookup, then the regex strip,
+    # then the (memoized) public-suffix parse — so a test domain never pays
+    # for tldextract work that would just be thrown away.
+    domain = domain.lower()
 
-    except asyncio.TimeoutError:
-        logger.error(f"⏰ Timeout checking MX records for {domain}")
-        return None
-    except aiodns.error.DNSError as e:
-        logger.error(f"⚠️ DNS error for {domain}: {e}")
+    if domain in TEST_DOMAINS:
+        logger.warning("⚠️ Test domain: %s", domain)
         return None
-    except Exception as e:
-        logger.exception(f"❌ Unexpected error: {e}")
+
+    domain = _SCHEME_RE.sub("", domain)
+
+    tld = _get_suffix(domain)
+    if tld in INVALID_TLDS:
+        logger.warning("⚠️ Invalid TLD: %s", tld)
         return None
 
+    if domain in _MX_CACHE:
+        logger.debug("📦 MX cache hit for %s", domain)
+        return _MX_CACHE[domain]
+
+    async with _MX_LOCKS[domain]:
+        # Another coroutine may have resolved this domain while we waited
+        if domain in _MX_CACHE:
+            logger.debug("📦 MX cache hit for %s (after lock)", domain)
+            return _MX_CACHE[domain]
+
+        try:
+            logger.info("🔎 Checking MX records for: %s", domain)
+
+            # The resolver's own timeout covers the query; no wait_for wrapper
+            response = await _get_resolver().query(domain, "MX")
+
+            if not response:
+                logger.warning("⚠️ No MX records for %s", domain)
+                _MX_CACHE[domain] = None
+                return None
+
+            mx_records = [str(rdata.host) for rdata in response]
+            logger.info("✅ Found MX records for %s: %s", domain, mx_records)
+            _MX_CACHE[domain] = mx_records
+            return mx_records
+
+        except aiodns.error.DNSError as e:
+            # c-ares reports timeouts as DNSError(ARES_ETIMEOUT); they're
+            # transient, so unlike NXDOMAIN/no-data don't cache the miss.
+            if e.args and e.args[0] == aiodns.error.ARES_ETIMEOUT:
+                logger.error("⏰ Timeout checking MX records for %s", domain)
+                return None
+            logger.error("⚠️ DNS error for %s: %s", domain, e)
+            _MX_CACHE[domain] = None
+            return None
+        except Exception as e:
+            logger.exception("❌ Unexpected error: %s", e)
+            return None
+
 
 # Safe test runner
 if __name__ == "__main__":
     async def main():
         test_domains = ["yahoo.com", "outlook.com", "example.com", "test.com", "localhost.com", "nonexistentdomain.com"]
-        tasks = [check_mx_records(domain) for domain in test_domains]
-        results = await asyncio.gather(*tasks)
 
-        for domain, mx_records in zip(test_domains, results):
+        # Bounded fan-out so this stays a safe template for large domain
+        # lists: the semaphore caps in-flight DNS queries, and TaskGroup
+        # cancels the siblings instead of leaving zombies if a lookup raises.
+        sem = asyncio.Semaphore(32)
+
+        async def run_check(domain):
+            async with sem:
+                return await check_mx_records(domain)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_check(domain)) for domain in test_domains]
+
+        for domain, task in zip(test_domains, tasks):
+            mx_records = task.result()
             if mx_records:
-                logger.info(f"MX records for {domain}: {mx_records}")
+                logger.info("MX records for %s: %s", domain, mx_records)
             else:
-                logger.warning(f"No MX records found for {domain} or domain does not exist.")
+                logger.warning("No MX records found for %s or domain does not exist.", domain)
 
     asyncio.run(main())
\ No newline at end of file